@@ -3,12 +3,15 @@ Core HTTP client for Alcatel Modem API
 Handles HTTP requests, authentication, retry logic, and token management
 """
 
+import itertools
 import json
 import os
-import platform
 import stat
+import threading
+from collections.abc import Awaitable, MutableMapping, Sequence
 from pathlib import Path
-from typing import Any, Literal, Protocol, Union
+from typing import TYPE_CHECKING, Any, Callable, Literal, Protocol, TypeVar, Union
+from weakref import WeakValueDictionary
 
 import httpx
 
@@ -26,8 +29,37 @@ from .exceptions import (
 from .utils.diagnostics import detect_modem_brand
 from .utils.logging import get_logger
 
+if TYPE_CHECKING:
+  import asyncio
+
+  import orjson
+else:
+  try:
+    import orjson as _orjson
+
+    orjson = _orjson  # type: ignore[assignment]
+  except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+
+
+def json_dumps(obj: Any) -> bytes:
+  """Serialize a JSON-RPC payload to compact UTF-8 JSON (uses orjson when installed)"""
+  if orjson is not None:
+    return orjson.dumps(obj)
+  return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def json_loads(content: bytes) -> Any:
+  """Parse a JSON response body (uses orjson when installed); raises ValueError on invalid JSON"""
+  if orjson is not None:
+    return orjson.loads(content)
+  return json.loads(content)
+
+
 # Default headers for API requests
 DEFAULT_VERIFICATION_KEY = "KSDHSDFOGQ5WERYTUIQWERTYUISDFG1HJZXCVCXBN2GDSMNDHKVKFsVBNf"
 
@@ -46,6 +78,18 @@ HTTP_STATUS_MESSAGES = {
 }
 
 
+# JSON-RPC error codes meaning the session token is missing or expired
+AUTH_ERROR_CODES = (-32699,)
+
+# Error message rules, checked in order against the lower-cased message:
+# (words that must all appear, words of which one must appear, exception, description)
+ERROR_MESSAGE_RULES: tuple[tuple[tuple[str, ...], tuple[str, ...], type[AlcatelAPIError], str], ...] = (
+  ((), ("busy",), AlcatelSystemBusyError, "Modem system is busy"),
+  (("sim",), ("missing", "not"), AlcatelSimMissingError, "SIM card issue"),
+  ((), ("not supported", "unsupported"), AlcatelFeatureNotSupportedError, "Feature not supported"),
+)
+
+
 def format_http_error(status_code: int, response_text: str = "") -> str:
   """
   Format HTTP error message with descriptive text
@@ -82,8 +126,32 @@ class TokenStorageProtocol(Protocol):
     ...
 
 
+def _default_session_file() -> str:
+  """Return the default session file path (~/.alcatel_modem_session)"""
+  return str(Path.home() / ".alcatel_modem_session")
+
+
 class FileTokenStorage:
-  """File-based token storage implementation"""
+  """File-based token storage implementation
+
+  Instances are shared per session file: constructing a storage for a path that
+  already has a live instance returns that instance, so every client using the
+  same file sees one in-memory token. The file is only read again when its
+  size or modification time changed since it was last read or written.
+  """
+
+  # Keyed by class as well as path, so a subclass never receives a base-class instance
+  _instances: "WeakValueDictionary[tuple[type, str], FileTokenStorage]" = WeakValueDictionary()
+  _initialized: bool
+
+  def __new__(cls, session_file: Union[str, None] = None) -> "FileTokenStorage":
+    path = os.path.abspath(session_file if session_file is not None else _default_session_file())
+    instance = cls._instances.get((cls, path))
+    if instance is None:
+      instance = super().__new__(cls)
+      instance._initialized = False
+      cls._instances[(cls, path)] = instance
+    return instance
 
   def __init__(self, session_file: Union[str, None] = None):
     """
@@ -92,51 +160,76 @@ class FileTokenStorage:
     Args:
         session_file: Path to session file (default: ~/.alcatel_modem_session)
     """
+    if self._initialized:
+      # Pick up changes made by other processes since the last read or write
+      if self._file_signature() != self._signature:
+        self._restore_token()
+      return
+
     if session_file is None:
-      home = Path.home()
-      session_file = str(home / ".alcatel_modem_session")
+      session_file = _default_session_file()
 
     self.session_file = session_file
     self._token: Union[str, None] = None
+    self._signature: Union[tuple[int, int], None] = None
     self._restore_token()
+    self._initialized = True
 
   def save_token(self, token: str) -> None:
     """Save token to file"""
     self._token = token
+    # Write to a temporary file created owner-only (600), then atomically move it
+    # into place, so a crash mid-write never leaves a truncated session file
+    tmp_file = self.session_file + ".tmp"
     try:
-      with open(self.session_file, "w") as f:
-        f.write(token)
-      # Set file permissions to 600 (read/write for owner only)
+      fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IRUSR | stat.S_IWUSR)
       try:
-        if platform.system() != "Windows":
-          os.chmod(self.session_file, stat.S_IRUSR | stat.S_IWUSR)
-        else:
-          os.chmod(self.session_file, stat.S_IREAD | stat.S_IWRITE)
-      except (OSError, AttributeError) as e:
-        logger.warning(f"Could not secure session file permissions: {e}")
+        os.write(fd, token.encode())
+      finally:
+        os.close(fd)
+      os.replace(tmp_file, self.session_file)
+      self._signature = self._file_signature()
     except Exception as e:
       logger.warning(f"Could not save token to file: {e}")
 
   def _restore_token(self) -> None:
     """Restore token from file"""
     try:
-      if os.path.exists(self.session_file):
-        with open(self.session_file) as f:
-          self._token = f.read().strip()
+      fd = os.open(self.session_file, os.O_RDONLY)
+      try:
+        # Tokens are well under 4 KiB, so a single read gets the whole file
+        self._token = os.read(fd, 4096).decode().strip()
+        file_stat = os.fstat(fd)
+        self._signature = (file_stat.st_mtime_ns, file_stat.st_size)
+      finally:
+        os.close(fd)
+    except FileNotFoundError:
+      self._token = None
+      self._signature = None
     except Exception as e:
       logger.debug(f"Could not restore token from file: {e}")
       self._token = None
 
+  def _file_signature(self) -> Union[tuple[int, int], None]:
+    """Return (mtime, size) of the session file, or None if it does not exist"""
+    try:
+      file_stat = os.stat(self.session_file)
+    except OSError:
+      return None
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
   def get_token(self) -> str:
-    """Get current token"""
+    """Get current token (cached in memory; the file is only read on initialization)"""
     return self._token if self._token else ""
 
   def clear_token(self) -> None:
     """Clear stored token"""
     self._token = None
+    self._signature = None
     try:
-      if os.path.exists(self.session_file):
-        os.remove(self.session_file)
+      os.remove(self.session_file)
+    except FileNotFoundError:
+      pass
     except Exception as e:
       logger.debug(f"Could not remove token file: {e}")
 
@@ -196,6 +289,10 @@ class AlcatelClient:
         async_client: Custom httpx.AsyncClient instance (optional, allows control of proxies, certs, etc.)
     """
     self._url = url.rstrip("/")
+    # JSON-RPC endpoint, posted to by every command
+    self._api_url = f"{self._url}/jrd/webapi"
+    # Source of JSON-RPC request IDs
+    self._rpc_ids = itertools.count(1)
     self._password = password
     self._timeout = timeout
 
@@ -205,6 +302,17 @@ class AlcatelClient:
     # Authentication strategy (will be detected on first login)
     self._auth_strategy: Union[AuthStrategy, None] = None
 
+    # Set once a login or password-protected command has succeeded in this process,
+    # so commands skip the up-front login check until the modem rejects the token
+    self._logged_in = False
+
+    # Serializes logins from threads (or tasks) sharing this client; the generation
+    # counts completed logins so a caller can tell whether someone else already logged in
+    self._login_lock = threading.Lock()
+    self._login_generation = 0
+    # asyncio.Lock for the async path, created on first use in the running event loop
+    self._async_login_lock: Union[tuple[asyncio.AbstractEventLoop, asyncio.Lock], None] = None
+
     # Token storage: use custom implementation if provided, otherwise default to file-based storage
     if token_storage is not None:
       self._token_manager = token_storage
@@ -225,6 +333,11 @@ class AlcatelClient:
     if token:
       self._default_headers["_TclRequestVerificationToken"] = token
 
+    # Connection pool limits for the clients we create. Limits prevent resource
+    # exhaustion when creating many client instances; the async client created
+    # on first use gets the same limits, even when a custom sync client is provided.
+    self._limits = connection_limits or httpx.Limits(max_keepalive_connections=5, max_connections=10)
+
     # Use provided clients or create new ones
     if client is not None:
       # Use provided client, but update headers
@@ -233,9 +346,8 @@ class AlcatelClient:
       self._client.headers.update(self._default_headers)
       self._client_owned = False  # Don't close client we didn't create
     else:
-      # Create httpx client with retry logic and connection pool limits
-      # Limits prevent resource exhaustion when creating many client instances
-      self._limits = connection_limits or httpx.Limits(max_keepalive_connections=5, max_connections=10)
+      # Create one long-lived httpx client with retry logic and connection pooling,
+      # so keep-alive connections are reused across commands
       retry_transport = httpx.HTTPTransport(retries=3)
       self._client = httpx.Client(
         timeout=timeout,
@@ -360,28 +472,38 @@ class AlcatelClient:
       if result.get("State") == 1:  # 1 = logged in, 0 = logged out
         token = self._token_manager.get_token()
         if token:
-          self._default_headers["_TclRequestVerificationToken"] = token
-          self._client.headers["_TclRequestVerificationToken"] = token
+          self._set_token_header(token)
           return True
       return False
     except Exception:
       return False
 
-  async def _get_login_state_async(self) -> bool:
-    """Check if already logged in (async)"""
-    try:
-      # Use _run_command_async directly
-      result = await self._run_command_async("GetLoginState")
-      if result.get("State") == 1:
-        token = self._token_manager.get_token()
-        if token:
-          self._default_headers["_TclRequestVerificationToken"] = token
-          if self._async_client:
-            self._async_client.headers["_TclRequestVerificationToken"] = token
-          return True
-      return False
-    except Exception:
+  def _set_token_header(self, token: str) -> None:
+    """Send token with requests from both HTTP clients; an empty token removes the header"""
+    headers: list[MutableMapping[str, str]] = [self._default_headers, self._client.headers]
+    if self._async_client is not None:
+      headers.append(self._async_client.headers)
+    for header_map in headers:
+      if token:
+        header_map["_TclRequestVerificationToken"] = token
+      else:
+        header_map.pop("_TclRequestVerificationToken", None)
+
+  def _use_stored_token(self) -> bool:
+    """
+    Send the stored token if it differs from the one in the request headers
+
+    The token storage can be shared (e.g. FileTokenStorage instances per session
+    file), so another client may have logged in and stored a newer token.
+
+    Returns:
+        True if the headers were updated
+    """
+    token = self._token_manager.get_token()
+    if token == self._default_headers.get("_TclRequestVerificationToken", ""):
       return False
+    self._set_token_header(token)
+    return True
 
   def _login(self) -> None:
     """Login to modem with admin credentials"""
@@ -418,10 +540,7 @@ class AlcatelClient:
       encrypted_token = self._auth_strategy.process_token(result)
 
       self._token_manager.save_token(encrypted_token)
-      self._default_headers["_TclRequestVerificationToken"] = encrypted_token
-      self._client.headers["_TclRequestVerificationToken"] = encrypted_token
-      if self._async_client is not None:
-        self._async_client.headers["_TclRequestVerificationToken"] = encrypted_token
+      self._set_token_header(encrypted_token)
 
     except Exception as e:
       if isinstance(e, AuthenticationError):
@@ -463,46 +582,118 @@ class AlcatelClient:
       encrypted_token = self._auth_strategy.process_token(result)
 
       self._token_manager.save_token(encrypted_token)
-      self._default_headers["_TclRequestVerificationToken"] = encrypted_token
-      if self._async_client:
-        self._async_client.headers["_TclRequestVerificationToken"] = encrypted_token
+      self._set_token_header(encrypted_token)
 
     except Exception as e:
       if isinstance(e, AuthenticationError):
         raise
       raise AuthenticationError(f"Login failed: {str(e)}")
 
-  def _run_command(self, command: str, **params: Any) -> dict[str, Any]:
+  def _build_rpc(self, command: str, params: Union[dict[str, Any], None]) -> dict[str, Any]:
     """
-    Execute a JSON-RPC command on the modem (sync)
+    Build a JSON-RPC 2.0 request object
+
+    Request IDs are taken from a per-client monotonic counter, so every
+    request of this client (including each command in a batch) has a distinct ID.
 
     Args:
         command: Command name
-        **params: Command parameters
+        params: Command parameters (empty params are sent as None)
+
+    Returns:
+        JSON-RPC request dictionary
+    """
+    return {
+      "jsonrpc": "2.0",
+      "method": command,
+      "id": str(next(self._rpc_ids)),
+      "params": params if params else None,
+    }
+
+  @staticmethod
+  def _parse_rpc_result(result: Any) -> dict[str, Any]:
+    """
+    Extract the result of a JSON-RPC response object, mapping errors to exceptions
+
+    Args:
+        result: Decoded JSON-RPC response object
 
     Returns:
         Command result dictionary
 
     Raises:
-        AlcatelAPIError: If command fails
-        AlcatelConnectionError: If connection fails
-        AlcatelTimeoutError: If request times out
+        AlcatelAPIError: If the response carries an error or no result
         AuthenticationError: If authentication fails
     """
-    # Handle empty params - use None instead of empty dict
-    params_value = params if params else None
+    if "error" in result:
+      error = result["error"]
+      error_code = error.get("code", "unknown")
+      error_msg = error.get("message", "Unknown error")
 
-    message = {
-      "jsonrpc": "2.0",
-      "method": command,
-      "id": "1",
-      "params": params_value,
-    }
+      # Check if it's an authentication error
+      if error_code in AUTH_ERROR_CODES or "Authentication" in error_msg:
+        raise AuthenticationError(f"Authentication failed: {error_msg}")
+
+      # Map common error messages to specific exceptions
+      error_msg_lower = error_msg.lower()
+      for required, any_of, exception_class, description in ERROR_MESSAGE_RULES:
+        if all(word in error_msg_lower for word in required) and any(word in error_msg_lower for word in any_of):
+          raise exception_class(f"{description}: {error_msg}", error_code=error_code)
+
+      raise AlcatelAPIError(f"Command failed: {error_msg} (code: {error_code})", error_code=error_code)
+
+    if "result" not in result:
+      raise AlcatelAPIError(f"Unexpected response: {result}")
+
+    return result["result"]  # type: ignore[no-any-return]
+
+  def _parse_batch_response(self, messages: list[dict[str, Any]], response: Any) -> list[dict[str, Any]]:
+    """
+    Match batch response objects to their requests by ID and extract each result
+
+    Args:
+        messages: JSON-RPC request objects, in call order
+        response: Decoded batch response
+
+    Returns:
+        Command results in the order of messages
+
+    Raises:
+        AlcatelAPIError: If the response is not a batch or lacks a response for a request
+        AuthenticationError: If authentication fails
+    """
+    if not isinstance(response, list):
+      # Modems answer a batch they reject with a single error object
+      if isinstance(response, dict) and "error" in response:
+        self._parse_rpc_result(response)
+      raise AlcatelAPIError(f"Unexpected batch response: {response}")
+
+    responses = {item.get("id"): item for item in response if isinstance(item, dict)}
+    results = []
+    for message in messages:
+      item = responses.get(message["id"])
+      if item is None:
+        raise AlcatelAPIError(f"No response for batched command {message['method']}")
+      results.append(self._parse_rpc_result(item))
+    return results
+
+  def _post_rpc(self, payload: Any) -> Any:
+    """
+    POST a JSON-RPC payload to the modem and decode the response (sync)
+
+    Args:
+        payload: JSON-RPC request object, or list of them for a batch
 
-    api_url = f"{self._url}/jrd/webapi"
+    Returns:
+        Decoded JSON response
 
+    Raises:
+        AlcatelAPIError: If the response is not JSON
+        AlcatelConnectionError: If connection fails
+        AlcatelTimeoutError: If request times out
+    """
     try:
-      resp = self._client.post(api_url, json=message)
+      resp = self._client.post(self._api_url, content=json_dumps(payload))
     except httpx.TimeoutException as e:
       raise AlcatelTimeoutError(f"Request timed out after {self._timeout} seconds: {str(e)}")
     except httpx.ConnectError as e:
@@ -519,80 +710,38 @@ class AlcatelClient:
 
     # Handle JSON decode errors
     try:
-      result = resp.json()
+      return json_loads(resp.content)
     except (ValueError, json.JSONDecodeError):
       raise AlcatelAPIError(f"Invalid response from modem (not JSON). HTTP {resp.status_code}: {resp.text[:200]}")
 
-    if "error" in result:
-      error = result["error"]
-      error_code = error.get("code", "unknown")
-      error_msg = error.get("message", "Unknown error")
-
-      # Check if it's an authentication error
-      if error_code == -32699 or "Authentication" in error_msg:
-        raise AuthenticationError(f"Authentication failed: {error_msg}")
-
-      # Map common error messages to specific exceptions
-      error_msg_lower = error_msg.lower()
-      if "system busy" in error_msg_lower or "busy" in error_msg_lower:
-        raise AlcatelSystemBusyError(f"Modem system is busy: {error_msg}", error_code=error_code)
-      if "sim" in error_msg_lower and ("missing" in error_msg_lower or "not" in error_msg_lower):
-        raise AlcatelSimMissingError(f"SIM card issue: {error_msg}", error_code=error_code)
-      if "not supported" in error_msg_lower or "unsupported" in error_msg_lower:
-        raise AlcatelFeatureNotSupportedError(f"Feature not supported: {error_msg}", error_code=error_code)
-
-      raise AlcatelAPIError(f"Command failed: {error_msg} (code: {error_code})", error_code=error_code)
-
-    if "result" not in result:
-      raise AlcatelAPIError(f"Unexpected response: {result}")
-
-    return result["result"]  # type: ignore[no-any-return]
-
-  async def _run_command_async(self, command: str, **params: Any) -> dict[str, Any]:
+  async def _post_rpc_async(self, payload: Any) -> Any:
     """
-    Execute a JSON-RPC command on the modem (async)
+    POST a JSON-RPC payload to the modem and decode the response (async)
 
     Args:
-        command: Command name
-        **params: Command parameters
+        payload: JSON-RPC request object, or list of them for a batch
 
     Returns:
-        Command result dictionary
+        Decoded JSON response
 
     Raises:
-        AlcatelAPIError: If command fails
+        AlcatelAPIError: If the response is not JSON
         AlcatelConnectionError: If connection fails
         AlcatelTimeoutError: If request times out
-        AuthenticationError: If authentication fails
     """
     # Create async client if not exists and not provided
     if self._async_client is None:
-      # Limits prevent resource exhaustion when creating many client instances
-      # Use the same limits as sync client (if we created sync client)
-      limits = getattr(self, "_limits", httpx.Limits(max_keepalive_connections=5, max_connections=10))
       retry_transport = httpx.AsyncHTTPTransport(retries=3)
       self._async_client = httpx.AsyncClient(
         timeout=self._timeout,
         transport=retry_transport,
         headers=self._default_headers.copy(),
-        limits=limits,
+        limits=self._limits,
       )
       self._async_client_owned = True
 
-    # Handle empty params - use None instead of empty dict
-    params_value = params if params else None
-
-    message = {
-      "jsonrpc": "2.0",
-      "method": command,
-      "id": "1",
-      "params": params_value,
-    }
-
-    api_url = f"{self._url}/jrd/webapi"
-
     try:
-      resp = await self._async_client.post(api_url, json=message)
+      resp = await self._async_client.post(self._api_url, content=json_dumps(payload))
     except httpx.TimeoutException as e:
       raise AlcatelTimeoutError(f"Request timed out after {self._timeout} seconds: {str(e)}")
     except httpx.ConnectError as e:
@@ -609,34 +758,180 @@ class AlcatelClient:
 
     # Handle JSON decode errors
     try:
-      result = resp.json()
+      return json_loads(resp.content)
     except (ValueError, json.JSONDecodeError):
       raise AlcatelAPIError(f"Invalid response from modem (not JSON). HTTP {resp.status_code}: {resp.text[:200]}")
 
-    if "error" in result:
-      error = result["error"]
-      error_code = error.get("code", "unknown")
-      error_msg = error.get("message", "Unknown error")
+  def _run_command(self, command: str, **params: Any) -> dict[str, Any]:
+    """
+    Execute a JSON-RPC command on the modem (sync)
 
-      # Check if it's an authentication error
-      if error_code == -32699 or "Authentication" in error_msg:
-        raise AuthenticationError(f"Authentication failed: {error_msg}")
+    Args:
+        command: Command name
+        **params: Command parameters
 
-      # Map common error messages to specific exceptions
-      error_msg_lower = error_msg.lower()
-      if "system busy" in error_msg_lower or "busy" in error_msg_lower:
-        raise AlcatelSystemBusyError(f"Modem system is busy: {error_msg}", error_code=error_code)
-      if "sim" in error_msg_lower and ("missing" in error_msg_lower or "not" in error_msg_lower):
-        raise AlcatelSimMissingError(f"SIM card issue: {error_msg}", error_code=error_code)
-      if "not supported" in error_msg_lower or "unsupported" in error_msg_lower:
-        raise AlcatelFeatureNotSupportedError(f"Feature not supported: {error_msg}", error_code=error_code)
+    Returns:
+        Command result dictionary
 
-      raise AlcatelAPIError(f"Command failed: {error_msg} (code: {error_code})", error_code=error_code)
+    Raises:
+        AlcatelAPIError: If command fails
+        AlcatelConnectionError: If connection fails
+        AlcatelTimeoutError: If request times out
+        AuthenticationError: If authentication fails
+    """
+    return self._parse_rpc_result(self._post_rpc(self._build_rpc(command, params)))
 
-    if "result" not in result:
-      raise AlcatelAPIError(f"Unexpected response: {result}")
+  async def _run_command_async(self, command: str, **params: Any) -> dict[str, Any]:
+    """
+    Execute a JSON-RPC command on the modem (async)
 
-    return result["result"]  # type: ignore[no-any-return]
+    Args:
+        command: Command name
+        **params: Command parameters
+
+    Returns:
+        Command result dictionary
+
+    Raises:
+        AlcatelAPIError: If command fails
+        AlcatelConnectionError: If connection fails
+        AlcatelTimeoutError: If request times out
+        AuthenticationError: If authentication fails
+    """
+    return self._parse_rpc_result(await self._post_rpc_async(self._build_rpc(command, params)))
+
+  def _needs_login(self) -> bool:
+    """Whether to log in before sending: only when there is no session (verified or stored token) to try optimistically"""
+    return not self._logged_in and not self._token_manager.get_token()
+
+  def _login_once(self, generation: int) -> None:
+    """
+    Log in, unless another thread has already done so since generation was read
+
+    Threads sharing a client that all find the token missing or rejected would
+    otherwise each send Login, and on modems that keep a single session every
+    login invalidates the token the previous one just obtained.
+
+    Args:
+        generation: Value of _login_generation read before sending the request
+    """
+    with self._login_lock:
+      if self._login_generation != generation:
+        return
+      self._logged_in = False
+      self._login()
+      self._login_generation += 1
+
+  async def _login_once_async(self, generation: int) -> None:
+    """
+    Log in, unless another task has already done so since generation was read (async)
+
+    Args:
+        generation: Value of _login_generation read before sending the request
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    if self._async_login_lock is None or self._async_login_lock[0] is not loop:
+      self._async_login_lock = (loop, asyncio.Lock())
+    async with self._async_login_lock[1]:
+      if self._login_generation != generation:
+        return
+      self._logged_in = False
+      await self._login_async()
+      self._login_generation += 1
+
+  def _with_login(self, send: Callable[[], _T]) -> _T:
+    """
+    Call send() with automatic login - sync
+
+    With a password set, a stored session token is tried optimistically
+    instead of probing GetLoginState first. If the modem rejects it, logs in
+    again and calls send() once more.
+
+    Args:
+        send: Function sending the request(s) and returning the parsed result
+
+    Returns:
+        Result of send()
+    """
+    if not self._password:
+      return send()
+
+    generation = self._login_generation
+    logged_in_now = False
+    if self._needs_login():
+      self._login_once(generation)
+      logged_in_now = True
+    else:
+      self._use_stored_token()
+
+    try:
+      result = send()
+    except AuthenticationError:
+      if logged_in_now:
+        raise
+      # Another client sharing the token storage may have logged in since the request
+      # was sent; try its token first, as logging in again would invalidate it
+      resent = False
+      if self._use_stored_token():
+        try:
+          result = send()
+          resent = True
+        except AuthenticationError:
+          pass
+      if not resent:
+        self._login_once(generation)
+        result = send()
+
+    self._logged_in = True
+    return result
+
+  async def _with_login_async(self, send: Callable[[], Awaitable[_T]]) -> _T:
+    """
+    Await send() with automatic login - async
+
+    With a password set, a stored session token is tried optimistically
+    instead of probing GetLoginState first. If the modem rejects it, logs in
+    again and awaits send() once more.
+
+    Args:
+        send: Function returning an awaitable that sends the request(s) and returns the parsed result
+
+    Returns:
+        Result of send()
+    """
+    if not self._password:
+      return await send()
+
+    generation = self._login_generation
+    logged_in_now = False
+    if self._needs_login():
+      await self._login_once_async(generation)
+      logged_in_now = True
+    else:
+      self._use_stored_token()
+
+    try:
+      result = await send()
+    except AuthenticationError:
+      if logged_in_now:
+        raise
+      # Another client sharing the token storage may have logged in since the request
+      # was sent; try its token first, as logging in again would invalidate it
+      resent = False
+      if self._use_stored_token():
+        try:
+          result = await send()
+          resent = True
+        except AuthenticationError:
+          pass
+      if not resent:
+        await self._login_once_async(generation)
+        result = await send()
+
+    self._logged_in = True
+    return result
 
   def run(self, command: str, **params: Any) -> dict[str, Any]:
     """
@@ -649,12 +944,7 @@ class AlcatelClient:
     Returns:
         Command result
     """
-    # Auto-login if password is set and not logged in
-    if self._password:
-      if not self._get_login_state():
-        self._login()
-
-    return self._run_command(command, **params)
+    return self._with_login(lambda: self._run_command(command, **params))
 
   async def run_async(self, command: str, **params: Any) -> dict[str, Any]:
     """
@@ -667,21 +957,105 @@ class AlcatelClient:
     Returns:
         Command result
     """
-    # Use fully async auth flow to avoid blocking
-    if self._password and not await self._get_login_state_async():
-      await self._login_async()
+    return await self._with_login_async(lambda: self._run_command_async(command, **params))
+
+  def _build_batch(self, calls: Sequence[tuple[str, Union[dict[str, Any], None]]]) -> list[dict[str, Any]]:
+    """Build one JSON-RPC request object per (command, params) call, with a distinct ID each"""
+    return [self._build_rpc(command, params) for command, params in calls]
+
+  def run_batch(self, calls: Sequence[tuple[str, Union[dict[str, Any], None]]]) -> list[dict[str, Any]]:
+    """
+    Run several commands in a single JSON-RPC batch request - sync
+
+    If the modem rejects the batch with an authentication error and a
+    password is set, logs in again and retries the whole batch once.
+
+    Args:
+        calls: Sequence of (command, params) tuples; params may be None
+
+    Returns:
+        Command results, in the order of calls
+
+    Raises:
+        AlcatelAPIError: If any command fails (the first failure is raised)
+    """
+    if not calls:
+      return []
+
+    messages = self._build_batch(calls)
+    return self._with_login(lambda: self._parse_batch_response(messages, self._post_rpc(messages)))
+
+  async def run_batch_async(self, calls: Sequence[tuple[str, Union[dict[str, Any], None]]]) -> list[dict[str, Any]]:
+    """
+    Run several commands in a single JSON-RPC batch request - async
+
+    If the modem rejects the batch with an authentication error and a
+    password is set, logs in again and retries the whole batch once.
+
+    Args:
+        calls: Sequence of (command, params) tuples; params may be None
+
+    Returns:
+        Command results, in the order of calls
+
+    Raises:
+        AlcatelAPIError: If any command fails (the first failure is raised)
+    """
+    if not calls:
+      return []
+
+    messages = self._build_batch(calls)
+
+    async def send() -> list[dict[str, Any]]:
+      return self._parse_batch_response(messages, await self._post_rpc_async(messages))
+
+    return await self._with_login_async(send)
+
+  def run_many(self, calls: Sequence[tuple[str, Union[dict[str, Any], None]]]) -> list[dict[str, Any]]:
+    """
+    Run several independent commands - sync
+
+    Commands are sent one after another; use run_many_async() to overlap
+    their round-trips, or run_batch() to send them in a single request. If
+    the modem rejects the session token and a password is set, logs in again
+    and re-sends all commands once.
+
+    Args:
+        calls: Sequence of (command, params) tuples; params may be None
+
+    Returns:
+        Command results, in the order of calls
+    """
+    return self._with_login(lambda: [self._run_command(command, **(params or {})) for command, params in calls])
+
+  async def run_many_async(self, calls: Sequence[tuple[str, Union[dict[str, Any], None]]]) -> list[dict[str, Any]]:
+    """
+    Run several independent commands concurrently - async
+
+    All commands are in flight at once (asyncio.gather over the connection
+    pool), so the total time is close to that of the slowest command rather
+    than the sum of all of them. If the modem rejects the session token and
+    a password is set, logs in again and re-sends all commands once.
+
+    Args:
+        calls: Sequence of (command, params) tuples; params may be None
+
+    Returns:
+        Command results, in the order of calls
+    """
+    # Imported here so that importing the client does not pull in asyncio
+    import asyncio
+
+    async def send() -> list[dict[str, Any]]:
+      return list(await asyncio.gather(*(self._run_command_async(command, **(params or {})) for command, params in calls)))
 
-    return await self._run_command_async(command, **params)
+    return await self._with_login_async(send)
 
   def logout(self) -> None:
     """Clear authentication token"""
     self._token_manager.clear_token()
-    if "_TclRequestVerificationToken" in self._default_headers:
-      del self._default_headers["_TclRequestVerificationToken"]
-    if "_TclRequestVerificationToken" in self._client.headers:
-      del self._client.headers["_TclRequestVerificationToken"]
-    if self._async_client and "_TclRequestVerificationToken" in self._async_client.headers:
-      del self._async_client.headers["_TclRequestVerificationToken"]
+    self._logged_in = False
+    self._set_token_header("")
 
   def close(self) -> None:
     """Close HTTP clients (only if we own them)"""
@@ -3,6 +3,8 @@ Constants for Alcatel Modem API
 Network types, connection statuses, etc.
 """
 
+from functools import lru_cache
+
 # Network Types mapping
 NETWORK_TYPES = {
   0: "No Service",
@@ -146,16 +148,22 @@ RESTRICTED_VERBS = [
 ]
 
 
+@lru_cache(maxsize=256)
+def _unknown(value: int) -> str:
+  """Format the name for an unmapped code, once per code"""
+  return f"Unknown ({value})"
+
+
 def get_network_type(network_type: int) -> str:
   """Get human-readable network type"""
-  return NETWORK_TYPES.get(network_type, f"Unknown ({network_type})")
+  return NETWORK_TYPES.get(network_type) or _unknown(network_type)
 
 
 def get_connection_status(status: int) -> str:
   """Get human-readable connection status"""
-  return CONNECTION_STATUSES.get(status, f"Unknown ({status})")
+  return CONNECTION_STATUSES.get(status) or _unknown(status)
 
 
 def get_sms_send_status(status: int) -> str:
   """Get human-readable SMS send status"""
-  return SMS_SEND_STATUS.get(status, f"Unknown ({status})")
+  return SMS_SEND_STATUS.get(status) or _unknown(status)
@@ -10,10 +10,15 @@ import time
 from collections.abc import Sequence
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from ..client import AlcatelClient
 from ..exceptions import AlcatelAPIError, AlcatelTimeoutError, AuthenticationError
 from ..models import SMSMessage
 
+# Validates a whole message list in a single call
+_SMS_LIST_ADAPTER = TypeAdapter(list[SMSMessage])
+
 
 class SMSEndpoint:
   """SMS operations namespace"""
@@ -161,6 +166,36 @@ class SMSEndpoint:
     """
     return await self._client.run_async("GetSendSMSResult")
 
+  @staticmethod
+  def _parse_sms_list(result: Any) -> Sequence[SMSMessage]:
+    """
+    Parse a GetSMSListByContactNum result into SMS messages
+
+    Args:
+        result: Command result, either a list of messages or a dict holding one
+
+    Returns:
+        List of SMS messages (entries that are not dicts are passed through unchanged)
+    """
+    # Result might be a dict with a list inside, or directly a list
+    messages: Any = None
+    if isinstance(result, dict):
+      # Look for common keys that might contain the list
+      for key in ["SMSList", "List", "Messages", "SMS"]:
+        if key in result and isinstance(result[key], list):
+          messages = result[key]
+          break
+    elif isinstance(result, list):
+      messages = result
+
+    if not messages:
+      return []
+
+    # Validate the whole list in one call when, as usual, every entry is a message dict
+    if all(isinstance(msg, dict) for msg in messages):
+      return _SMS_LIST_ADAPTER.validate_python(messages)
+    return [SMSMessage.from_dict(msg) if isinstance(msg, dict) else msg for msg in messages]
+
   def list(self, contact_number: str | None = None) -> Sequence[SMSMessage]:
     """
     Get SMS list
@@ -189,18 +224,7 @@ class SMSEndpoint:
       error_msg = result.get("error", {}).get("message", "Unknown error")
       raise AlcatelAPIError(f"SMS list retrieval failed: {error_msg}")
 
-    # Result might be a dict with a list inside, or directly a list
-    if isinstance(result, dict):
-      # Look for common keys that might contain the list
-      for key in ["SMSList", "List", "Messages", "SMS"]:
-        if key in result and isinstance(result[key], list):
-          return [SMSMessage.from_dict(msg) if isinstance(msg, dict) else msg for msg in result[key]]
-      return []
-
-    if isinstance(result, list):
-      return [SMSMessage.from_dict(msg) if isinstance(msg, dict) else msg for msg in result]
-
-    return []
+    return self._parse_sms_list(result)
 
   async def list_async(self, contact_number: str | None = None) -> Sequence[SMSMessage]:
     """
@@ -230,18 +254,7 @@ class SMSEndpoint:
       error_msg = result.get("error", {}).get("message", "Unknown error")
       raise AlcatelAPIError(f"SMS list retrieval failed: {error_msg}")
 
-    # Result might be a dict with a list inside, or directly a list
-    if isinstance(result, dict):
-      # Look for common keys that might contain the list
-      for key in ["SMSList", "List", "Messages", "SMS"]:
-        if key in result and isinstance(result[key], list):
-          return [SMSMessage.from_dict(msg) if isinstance(msg, dict) else msg for msg in result[key]]
-      return []
-
-    if isinstance(result, list):
-      return [SMSMessage.from_dict(msg) if isinstance(msg, dict) else msg for msg in result]
-
-    return []
+    return self._parse_sms_list(result)
 
   def get_contact_list(self) -> Sequence[dict[str, Any]]:
     """Get SMS contact list"""
@@ -5,7 +5,32 @@ Provides better IDE autocompletion, type safety, and data validation
 
 from typing import Any, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Upper-cased string values the modem uses for "no value"
+_NULL_STRINGS = frozenset(("", "N/A", "NA", "NULL", "NONE"))
+
+
+def estimate_signal_quality(rsrp: Union[int, None], rssi: Union[int, None]) -> int:
+  """
+  Estimate signal quality percentage based on RSRP, falling back to RSSI
+
+  Args:
+      rsrp: Reference signal received power in dBm
+      rssi: Received signal strength indicator in dBm
+
+  Returns:
+      Signal quality percentage (0-100)
+  """
+  if rsrp is not None:
+    # RSRP mapping: -140 (0%) to -44 (100%)
+    val = max(-140, min(-44, rsrp))
+    return int((val + 140) * (100 / 96))
+  if rssi is not None:
+    # Fallback to RSSI: -113 (0%) to -51 (100%)
+    val = max(-113, min(-51, rssi))
+    return int((val + 113) * (100 / 62))
+  return 0
 
 
 def coerce_int_or_none(v: Any) -> Union[int, None]:
@@ -17,7 +42,7 @@ def coerce_int_or_none(v: Any) -> Union[int, None]:
     return None
   if isinstance(v, str):
     v = v.strip()
-    if v == "" or v.upper() in ("N/A", "NA", "NULL", "NONE"):
+    if v.upper() in _NULL_STRINGS:
       return None
     try:
       return int(v)
@@ -42,7 +67,7 @@ def coerce_str_or_none(v: Any) -> Union[str, None]:
     return None
   if isinstance(v, str):
     stripped: str = v.strip()
-    if stripped == "" or stripped.upper() in ("N/A", "NA", "NULL", "NONE"):
+    if stripped.upper() in _NULL_STRINGS:
       return None
     return stripped
   if v:
@@ -108,6 +133,16 @@ class ExtendedStatus(BaseModel):
     """Convert signal metrics to int or None, handling empty strings and N/A"""
     return coerce_int_or_none(v)
 
+  @property
+  def signal_quality_percent(self) -> int:
+    """
+    Estimate signal quality percentage based on RSRP/RSSI
+
+    Returns:
+        Signal quality percentage (0-100)
+    """
+    return estimate_signal_quality(self.rsrp, self.rssi)
+
   @classmethod
   def from_dict(cls, data: dict[str, Any]) -> "ExtendedStatus":
     """Create ExtendedStatus from API response dict"""
@@ -117,30 +152,13 @@ class ExtendedStatus(BaseModel):
 class SMSMessage(BaseModel):
   """SMS message information"""
 
-  sms_id: int = Field(alias="SMSId", default=-1)
-  phone_number: str = Field(alias="PhoneNumber", default="")
-  content: str = Field(alias="SMSContent", default="")
-  timestamp: Union[str, None] = Field(alias="SMSTime", default=None)
+  # Some firmware versions use the alternative key names listed second
+  sms_id: int = Field(alias="SMSId", validation_alias=AliasChoices("SMSId", "Id"), default=-1)
+  phone_number: str = Field(alias="PhoneNumber", validation_alias=AliasChoices("PhoneNumber", "Phone"), default="")
+  content: str = Field(alias="SMSContent", validation_alias=AliasChoices("SMSContent", "Content"), default="")
+  timestamp: Union[str, None] = Field(alias="SMSTime", validation_alias=AliasChoices("SMSTime", "Time"), default=None)
   status: Union[int, None] = Field(alias="Status", default=None)
-  read: Union[bool, None] = Field(alias="Read", default=None)
-
-  @model_validator(mode="before")
-  @classmethod
-  def handle_alternative_keys(cls, data: Any) -> Any:
-    """Handle alternative field names in the data dict"""
-    if isinstance(data, dict):
-      # Handle alternative key names
-      if "Id" in data and "SMSId" not in data:
-        data["SMSId"] = data["Id"]
-      if "Phone" in data and "PhoneNumber" not in data:
-        data["PhoneNumber"] = data["Phone"]
-      if "Content" in data and "SMSContent" not in data:
-        data["SMSContent"] = data["Content"]
-      if "Time" in data and "SMSTime" not in data:
-        data["SMSTime"] = data["Time"]
-      if "IsRead" in data and "Read" not in data:
-        data["Read"] = data["IsRead"]
-    return data
+  read: Union[bool, None] = Field(alias="Read", validation_alias=AliasChoices("Read", "IsRead"), default=None)
 
   @classmethod
   def from_dict(cls, data: dict[str, Any]) -> "SMSMessage":
@@ -180,15 +198,7 @@ class NetworkInfo(BaseModel):
     Returns:
         Signal quality percentage (0-100)
     """
-    if self.rsrp is not None:
-      # RSRP mapping: -140 (0%) to -44 (100%)
-      val = max(-140, min(-44, self.rsrp))
-      return int((val + 140) * (100 / 96))
-    if self.rssi is not None:
-      # Fallback to RSSI: -113 (0%) to -51 (100%)
-      val = max(-113, min(-51, self.rssi))
-      return int((val + 113) * (100 / 62))
-    return 0
+    return estimate_signal_quality(self.rsrp, self.rssi)
 
   model_config = ConfigDict(populate_by_name=True)
 
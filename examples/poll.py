@@ -3,7 +3,6 @@
 Poll example - Basic and Extended status polling
 """
 
-import json
 import sys
 from pathlib import Path
 
@@ -15,6 +14,7 @@ from alcatel_modem_api import AlcatelClient
 
 def main():
   import argparse
+  import json
 
   parser = argparse.ArgumentParser(description="Poll modem status")
   parser.add_argument("-u", "--url", default="http://192.168.1.1", help="Modem URL")
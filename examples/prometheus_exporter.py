@@ -7,190 +7,512 @@ Based on: https://github.com/philalex/nos-modem-alcatel-mw40v-prometheus-exporth
 """
 
 import sys
+import threading
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Union
+
+import httpx
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from alcatel_modem_api import AlcatelClient
+from alcatel_modem_api.models import ConnectionState, NetworkInfo, SystemStatus
+
+
+def model_attributes(model) -> dict:
+  """Map API response keys (field aliases) to model attribute names"""
+  return {field.alias or name: name for name, field in model.model_fields.items()}
+
+
+def attribute_table(model, table) -> tuple:
+  """
+  Resolve the response keys of a metric table to model attribute names
+
+  Keys the model does not define are kept as-is; the generated renderer
+  emits the metric default for them.
+  """
+  attributes = model_attributes(model)
+  return tuple((name, attributes.get(key, key), extra) for name, key, extra in table)
+
+
+# Label block shared by every metric line, filled from the modem's system info
+LABEL_BLOCK_TEMPLATE = '{{imei="{imei}",imsi="{imsi}",mac_address="{mac_address}"}} '
+
+# (metric name, response key, default) for each metric table
+SYSTEM_METRICS = attribute_table(
+  SystemStatus,
+  (
+    ("battery_capacity_percent", "bat_cap", 0),
+    ("battery_level", "bat_level", 0),
+    ("current_connection_count", "curr_num", 0),
+    ("total_connection_count", "TotalConnNum", 0),
+    ("signal_strength", "SignalStrength", 0),
+    ("roaming", "Roaming", 0),
+    ("domestic_roaming", "Domestic_Roaming", 0),
+    ("network_type", "NetworkType", 0),
+  ),
+)
+
+CONNECTION_METRICS = attribute_table(
+  ConnectionState,
+  (
+    ("connection_status", "ConnectionStatus", 0),
+    ("speed_download", "Speed_Dl", 0),
+    ("speed_upload", "Speed_Ul", 0),
+    ("download_rate", "DlRate", 0),
+    ("upload_rate", "UlRate", 0),
+    ("download_bytes", "DlBytes", 0),
+    ("upload_bytes", "UlBytes", 0),
+    ("connection_time", "ConnectionTime", 0),
+  ),
+)
+
+# Signal quality metrics (from Munin plugin) are only exported when present,
+# so these entries carry a cast instead of a default
+NETWORK_METRICS = attribute_table(
+  NetworkInfo,
+  (
+    ("sinr", "SINR", int),
+    ("rsrp", "RSRP", int),
+    ("rssi", "RSSI", int),
+    ("rsrq", "RSRQ", int),
+    ("ecio", "EcIo", float),
+    ("rscp", "RSCP", int),
+    ("cell_id", "CellId", None),
+    ("enb_id", "eNBID", None),
+  ),
+)
+
+SMS_METRICS = (
+  ("unread_sms_count", "UnreadSMSCount", 0),
+  ("sms_left_count", "LeftCount", 0),
+  ("sms_max_count", "MaxCount", 0),
+  ("sms_total_used", "TUseCount", 0),
+)
+
+
+def compile_renderer(label_block: str):
+  """
+  Generate a metrics render function specialised to one label block
+
+  The source is built from the metric tables with every "name{labels} "
+  prefix inlined as a string constant, then compiled once. Steady-state
+  rendering only reads values, converts them and joins the pieces.
+
+  Args:
+      label_block: Formatted label block, e.g. '{imei="..."} '
+
+  Returns:
+      Function render(status, network, connection, sms) -> str
+  """
+  # Builtins and bound methods are passed in or hoisted to locals so each
+  # metric line avoids repeated global and attribute lookups
+  lines = [
+    "def render(status, network, connection, sms, str=str, format=format):",
+    "  parts = []",
+    "  append = parts.append",
+  ]
+
+  def model_lines(indent, obj, model, table):
+    # Model fields are read as plain attributes; keys the model does not
+    # define always yield the default, which is folded into the constant
+    for name, attribute, default in table:
+      if attribute in model.model_fields:
+        lines.append(f"{indent}append({name + label_block!r})")
+        lines.append(f"{indent}append(str({obj}.{attribute}))")
+        lines.append(f"{indent}append('\\n')")
+      else:
+        lines.append(f"{indent}append({name + label_block + str(default) + chr(10)!r})")
+
+  model_lines("  ", "status", SystemStatus, SYSTEM_METRICS)
+
+  # NetworkInfo drops response keys it does not define, so those metrics
+  # could never be present and get no code at all. Fields the model already
+  # validates to int need no cast; floats use the compact 'g' format.
+  network_fields = NetworkInfo.model_fields
+  lines.append("  if network is not None:")
+  for name, attribute, cast in NETWORK_METRICS:
+    if attribute not in network_fields:
+      continue
+    annotation = network_fields[attribute].annotation
+    if cast is float:
+      value = "format(value, 'g')"
+    elif cast is None or annotation in (int, Union[int, None]):
+      value = "str(value)"
+    else:
+      value = f"str({cast.__name__}(value))"
+    lines.append(f"    value = network.{attribute}")
+    lines.append("    if value is not None:")
+    lines.append(f"      append({name + label_block!r})")
+    lines.append(f"      append({value})")
+    lines.append("      append('\\n')")
+
+  lines.append("  if connection is not None:")
+  model_lines("    ", "connection", ConnectionState, CONNECTION_METRICS)
+
+  lines.append("  if sms:")
+  lines.append("    sms_get = sms.get")
+  for name, key, default in SMS_METRICS:
+    lines.append(f"    append({name + label_block!r})")
+    lines.append(f"    append(str(sms_get({key!r}, {default!r})))")
+    lines.append("    append('\\n')")
+
+  lines.append("  return ''.join(parts)")
+
+  namespace = {}
+  exec(compile("\n".join(lines) + "\n", "<prometheus-render>", "exec"), namespace)  # nosec B102 - source is generated from constant tables
+  return namespace["render"]
+
+
+# Number of modem queries issued concurrently per collection
+QUERY_WORKERS = 4
+
+# Pre-formatted HTTP responses; /metrics responses are built once per collection
+METRICS_RESPONSE_HEAD = b"HTTP/1.1 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\nContent-Length: %d\r\nConnection: close\r\n\r\n"
+NOT_FOUND_RESPONSE = b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+
+# Landing page served at /; it never changes, so its full response is built at import time
+ROOT_HTML = b"""<html>
+<head><title>Alcatel Modem Prometheus Exporter</title></head>
+<body>
+<h1>Alcatel Modem Prometheus Exporter</h1>
+<p><a href="/metrics">Metrics</a></p>
+</body>
+</html>
+"""
+ROOT_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nContent-Length: %d\r\nConnection: close\r\n\r\n" % (len(ROOT_HTML),) + ROOT_HTML
 
 
 class PrometheusExporter:
   """Prometheus metrics exporter for Alcatel modems"""
 
-  def __init__(self, api: AlcatelClient, update_interval: int = 10):
+  def __init__(self, api: AlcatelClient, update_interval: int = 10, min_interval: Union[int, None] = None):
     """
     Initialize exporter
 
     Args:
         api: AlcatelClient instance
         update_interval: Update interval in seconds (default: 10)
+        min_interval: Minimum seconds between modem collections, however they
+            are triggered (default: the larger of 5 and update_interval)
     """
     self.api = api
     self.update_interval = update_interval
-    self.metrics = {}
+    self.min_interval = max(5, update_interval) if min_interval is None else min_interval
     self.last_update = 0
+    # Start time (monotonic) of the last collection, and a guard against overlapping ones
+    self._last_collect = float("-inf")
+    self._collecting = threading.Lock()
+    # UTF-8 encoded payload, and the complete HTTP response that serves it
+    self._payload = b""
+    self._response = METRICS_RESPONSE_HEAD % (0,)
+    self._lock = threading.Lock()
+    # Render function compiled for the IMEI/IMSI/MAC labels, which never change while the exporter runs
+    self._render = None
+    # Background collector (see start()), so scrapes never wait on the modem
+    self._stop = threading.Event()
+    self._thread = threading.Thread(target=self._run, name="metrics-collector", daemon=True)
+    # Modem queries are latency-bound, so they are issued concurrently
+    self._executor = ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix="metrics-query")
+
+  def _get_renderer(self):
+    """Get the metrics render function, fetching system info and compiling it on first use only"""
+    if self._render is None:
+      system_info = self.api.system.get_info()
+      labels = {
+        "imei": system_info.get("IMEI", "unknown"),
+        "imsi": system_info.get("IMSI", "unknown"),
+        "mac_address": system_info.get("MacAddress", "unknown").strip(),
+      }
+      self._render = compile_renderer(LABEL_BLOCK_TEMPLATE.format_map(labels))
+    return self._render
 
   def collect_metrics(self):
-    """Collect metrics from modem"""
+    """
+    Collect metrics from modem
+
+    Returns early, keeping the current payload, if another collection is in
+    progress or the previous one started less than min_interval seconds ago.
+    This protects the modem's slow web server from fast or concurrent scrapes.
+    """
+    if not self._collecting.acquire(blocking=False):
+      return
     try:
-      # Get system info (once, doesn't change often)
-      system_info = self.api.system.get_info()
-      imei = system_info.get("IMEI", "unknown")
-      imsi = system_info.get("IMSI", "unknown")
-      mac_address = system_info.get("MacAddress", "unknown").strip()
+      now = time.monotonic()
+      if now - self._last_collect < self.min_interval:
+        return
+      self._last_collect = now
+      self._collect()
+    finally:
+      self._collecting.release()
+
+  def _collect(self):
+    """Query the modem and publish a freshly rendered payload"""
+    try:
+      render = self._get_renderer()
+
+      # Dispatch all modem queries at once; each result is still handled best-effort below
+      submit = self._executor.submit
+      status_future = submit(self.api.system.get_status)
+      network_future = submit(self.api.network.get_info)
+      connection_future = submit(self.api.network.get_connection_state)
+      sms_future = submit(self.api.sms.get_storage_state)
 
       # Get system status (returns Pydantic model)
-      system_status = self.api.system.get_status()
-      status_dict = system_status.model_dump()
+      system_status = status_future.result()
 
       # Get network info (requires login) - for detailed signal metrics
       network_info = None
       try:
-        network_info = self.api.network.get_info()
+        network_info = network_future.result()
       except Exception:
         pass
 
       # Get connection state (requires login)
       connection_state = None
       try:
-        connection_state = self.api.network.get_connection_state()
+        connection_state = connection_future.result()
       except Exception:
         pass
 
       # Get SMS storage state (public command, no login needed)
       sms_storage = None
       try:
-        sms_storage = self.api.sms.get_storage_state()
+        sms_storage = sms_future.result()
       except Exception as e:
         # Log error but continue
         print(f"Warning: Could not get SMS storage state: {e}", file=sys.stderr)
 
-      # Build metrics
-      labels = f'imei="{imei}",imsi="{imsi}",mac_address="{mac_address}"'
-
-      metrics = []
-
-      # System Status Metrics
-      metrics.append(f"battery_capacity_percent{{{labels}}} {status_dict.get('bat_cap', 0)}")
-      metrics.append(f"battery_level{{{labels}}} {status_dict.get('bat_level', 0)}")
-      metrics.append(f"current_connection_count{{{labels}}} {status_dict.get('curr_num', 0)}")
-      metrics.append(f"total_connection_count{{{labels}}} {status_dict.get('TotalConnNum', 0)}")
-      metrics.append(f"signal_strength{{{labels}}} {status_dict.get('SignalStrength', 0)}")
-      metrics.append(f"roaming{{{labels}}} {status_dict.get('Roaming', 0)}")
-      metrics.append(f"domestic_roaming{{{labels}}} {status_dict.get('Domestic_Roaming', 0)}")
-      metrics.append(f"network_type{{{labels}}} {status_dict.get('NetworkType', 0)}")
-
-      # Network Info Metrics (detailed signal info)
-      if network_info:
-        network_dict = network_info.model_dump()
-        # Signal quality metrics (from Munin plugin)
-        if network_dict.get("SINR") is not None:
-          metrics.append(f"sinr{{{labels}}} {int(network_dict.get('SINR', -999))}")
-        if network_dict.get("RSRP") is not None:
-          metrics.append(f"rsrp{{{labels}}} {int(network_dict.get('RSRP', -999))}")
-        if network_dict.get("RSSI") is not None:
-          metrics.append(f"rssi{{{labels}}} {int(network_dict.get('RSSI', -999))}")
-        if network_dict.get("RSRQ") is not None:
-          metrics.append(f"rsrq{{{labels}}} {int(network_dict.get('RSRQ', -999))}")
-        if network_dict.get("EcIo") is not None:
-          metrics.append(f"ecio{{{labels}}} {float(network_dict.get('EcIo', 0))}")
-        if network_dict.get("RSCP") is not None:
-          metrics.append(f"rscp{{{labels}}} {int(network_dict.get('RSCP', -999))}")
-        if network_dict.get("CellId") is not None:
-          metrics.append(f"cell_id{{{labels}}} {network_dict.get('CellId', 0)}")
-        if network_dict.get("eNBID") is not None:
-          metrics.append(f"enb_id{{{labels}}} {network_dict.get('eNBID', 0)}")
-
-      # Connection State Metrics
-      if connection_state:
-        conn_dict = connection_state.model_dump()
-        metrics.append(f"connection_status{{{labels}}} {conn_dict.get('ConnectionStatus', 0)}")
-        metrics.append(f"speed_download{{{labels}}} {conn_dict.get('Speed_Dl', 0)}")
-        metrics.append(f"speed_upload{{{labels}}} {conn_dict.get('Speed_Ul', 0)}")
-        metrics.append(f"download_rate{{{labels}}} {conn_dict.get('DlRate', 0)}")
-        metrics.append(f"upload_rate{{{labels}}} {conn_dict.get('UlRate', 0)}")
-        metrics.append(f"download_bytes{{{labels}}} {conn_dict.get('DlBytes', 0)}")
-        metrics.append(f"upload_bytes{{{labels}}} {conn_dict.get('UlBytes', 0)}")
-        metrics.append(f"connection_time{{{labels}}} {conn_dict.get('ConnectionTime', 0)}")
-
-      # SMS Metrics
-      if sms_storage:
-        metrics.append(f"unread_sms_count{{{labels}}} {sms_storage.get('UnreadSMSCount', 0)}")
-        metrics.append(f"sms_left_count{{{labels}}} {sms_storage.get('LeftCount', 0)}")
-        metrics.append(f"sms_max_count{{{labels}}} {sms_storage.get('MaxCount', 0)}")
-        metrics.append(f"sms_total_used{{{labels}}} {sms_storage.get('TUseCount', 0)}")
-
-      self.metrics = metrics
+      self._set_payload(render(system_status, network_info, connection_state, sms_storage))
       self.last_update = time.time()
 
     except Exception as e:
       print(f"Error collecting metrics: {e}", file=sys.stderr)
-      self.metrics = [f"# Error collecting metrics: {e}"]
+      self._set_payload(f"# Error collecting metrics: {e}\n")
+
+  def _set_payload(self, text: str):
+    """Encode metrics text and build its HTTP response once, then publish both for request handlers"""
+    payload = text.encode("utf-8")
+    response = METRICS_RESPONSE_HEAD % (len(payload),) + payload
+    with self._lock:
+      self._payload = payload
+      self._response = response
+
+  def _run(self):
+    """Collector thread loop: refresh metrics every update_interval seconds"""
+    while not self._stop.wait(self.update_interval):
+      self.collect_metrics()
 
-  def get_metrics(self) -> str:
-    """Get metrics in Prometheus format"""
-    current_time = time.time()
+  def start(self):
+    """Start collecting metrics in a background thread"""
+    self._thread.start()
 
-    # Update metrics if needed
-    if current_time - self.last_update >= self.update_interval:
+  def stop(self):
+    """Stop the background collector thread"""
+    self._stop.set()
+    if self._thread.is_alive():
+      self._thread.join()
+    self._executor.shutdown(wait=False)
+
+  def _refresh(self):
+    """
+    Collect metrics on demand if stale
+
+    Only used when the background collector is not running; otherwise
+    callers just read its latest snapshot.
+    """
+    if not self._thread.is_alive() and time.time() - self.last_update >= self.update_interval:
       self.collect_metrics()
 
-    return "\n".join(self.metrics) + "\n"
-
-
-class MetricsHandler(BaseHTTPRequestHandler):
-  """HTTP handler for Prometheus metrics endpoint"""
-
-  def __init__(self, exporter, *args, **kwargs):
-    self.exporter = exporter
-    super().__init__(*args, **kwargs)
-
-  def do_GET(self):
-    """Handle GET requests"""
-    if self.path == "/metrics":
-      metrics = self.exporter.get_metrics()
-      self.send_response(200)
-      self.send_header("Content-Type", "text/plain; version=0.0.4")
-      self.end_headers()
-      self.wfile.write(metrics.encode("utf-8"))
-    elif self.path == "/":
-      self.send_response(200)
-      self.send_header("Content-Type", "text/html")
-      self.end_headers()
-      html = """
-            <html>
-            <head><title>Alcatel Modem Prometheus Exporter</title></head>
-            <body>
-            <h1>Alcatel Modem Prometheus Exporter</h1>
-            <p><a href="/metrics">Metrics</a></p>
-            </body>
-            </html>
-            """
-      self.wfile.write(html.encode("utf-8"))
-    else:
-      self.send_response(404)
-      self.end_headers()
+  def get_payload(self) -> bytes:
+    """Get UTF-8 encoded metrics in Prometheus format"""
+    self._refresh()
+    with self._lock:
+      return self._payload
+
+  def get_response(self) -> bytes:
+    """Get a complete HTTP response (status line, headers and body) for /metrics"""
+    self._refresh()
+    with self._lock:
+      return self._response
 
-  def log_message(self, format, *args):
-    """Suppress default logging"""
-    pass
+  def get_metrics(self) -> str:
+    """Get metrics in Prometheus format as text (for debugging)"""
+    return self.get_payload().decode("utf-8")
 
 
 def create_handler(exporter):
-  """Create handler with exporter"""
+  """
+  Create a request handler class bound to the exporter
+
+  http.server is imported here rather than at module level so that importing
+  this module for PrometheusExporter alone stays cheap.
+  """
+  from http.server import BaseHTTPRequestHandler
+
+  class MetricsHandler(BaseHTTPRequestHandler):
+    """HTTP handler for Prometheus metrics endpoint"""
+
+    def do_GET(self):
+      """Handle GET requests"""
+      if self.path == "/metrics":
+        # Status line, headers and body go out in a single write
+        self.wfile.write(exporter.get_response())
+        self.close_connection = True
+      elif self.path == "/":
+        self.wfile.write(ROOT_RESPONSE)
+        self.close_connection = True
+      else:
+        self.send_response(404)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+      """Suppress default logging"""
+      pass
+
+  return MetricsHandler
 
-  def handler(*args, **kwargs):
-    return MetricsHandler(exporter, *args, **kwargs)
 
-  return handler
+# Request size limit for the --fast-server loop
+FAST_MAX_REQUEST_SIZE = 8192
+
+
+def serve_fast(exporter, port):
+  """
+  Serve /metrics from a single-threaded selectors loop
+
+  Reads each request until the end of its headers, matches the request line
+  with a single startswith() and writes a pre-formatted response. This avoids
+  the per-request BaseHTTPRequestHandler allocation and header parsing.
+
+  Args:
+      exporter: PrometheusExporter instance
+      port: Port to listen on
+  """
+  import selectors
+  import socket
+
+  selector = selectors.DefaultSelector()
+  server = socket.create_server(("", port))
+  server.setblocking(False)
+  selector.register(server, selectors.EVENT_READ)
+
+  def close(conn):
+    selector.unregister(conn)
+    conn.close()
+
+  try:
+    while True:
+      for key, _ in selector.select():
+        conn = key.fileobj
+
+        if conn is server:
+          try:
+            client, _ = server.accept()
+          except BlockingIOError:
+            continue
+          client.setblocking(False)
+          selector.register(client, selectors.EVENT_READ, bytearray())
+          continue
+
+        if isinstance(key.data, bytearray):
+          # Reading request headers
+          try:
+            chunk = conn.recv(4096)
+          except (BlockingIOError, InterruptedError):
+            continue
+          except OSError:
+            close(conn)
+            continue
+          if not chunk:
+            close(conn)
+            continue
+
+          request = key.data
+          request += chunk
+          if b"\r\n\r\n" not in request:
+            if len(request) > FAST_MAX_REQUEST_SIZE:
+              close(conn)
+            continue
+
+          if request.startswith(b"GET /metrics "):
+            response = exporter.get_response()
+          elif request.startswith(b"GET / "):
+            response = ROOT_RESPONSE
+          else:
+            response = NOT_FOUND_RESPONSE
+          selector.modify(conn, selectors.EVENT_WRITE, memoryview(response))
+          continue
+
+        # Writing response
+        try:
+          sent = conn.send(key.data)
+        except (BlockingIOError, InterruptedError):
+          continue
+        except OSError:
+          close(conn)
+          continue
+        remaining = key.data[sent:]
+        if remaining:
+          selector.modify(conn, selectors.EVENT_WRITE, remaining)
+        else:
+          close(conn)
+  finally:
+    for key in list(selector.get_map().values()):
+      key.fileobj.close()
+    selector.close()
+
+
+def serve_asyncio(exporter, port):
+  """
+  Serve /metrics from an asyncio stream server
+
+  Connections are handled as coroutines on one event loop, so many
+  concurrent scrapers cost a coroutine each rather than a thread. Metrics
+  are still collected by the exporter's background thread; handlers only
+  write its cached response.
+
+  Args:
+      exporter: PrometheusExporter instance
+      port: Port to listen on
+  """
+  import asyncio
+
+  async def handle(reader, writer):
+    try:
+      request = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+      writer.close()
+      return
+
+    if request.startswith(b"GET /metrics "):
+      response = exporter.get_response()
+    elif request.startswith(b"GET / "):
+      response = ROOT_RESPONSE
+    else:
+      response = NOT_FOUND_RESPONSE
+    writer.write(response)
+    try:
+      await writer.drain()
+    except ConnectionError:
+      pass
+    writer.close()
+
+  async def run():
+    server = await asyncio.start_server(handle, port=port, limit=FAST_MAX_REQUEST_SIZE)
+    async with server:
+      await server.serve_forever()
+
+  asyncio.run(run())
 
 
 def main():
   import argparse
   import os
+  from http.server import ThreadingHTTPServer
 
   parser = argparse.ArgumentParser(description="Prometheus exporter for Alcatel Modem")
   parser.add_argument("-u", "--url", default=os.getenv("MODEM_URL", "http://192.168.1.1"), help="Modem URL (default: http://192.168.1.1 or MODEM_URL env)")
@@ -199,39 +521,71 @@ def main():
   parser.add_argument(
     "--interval", type=int, default=int(os.getenv("UPDATE_INTERVAL", "10")), help="Update interval in seconds (default: 10 or UPDATE_INTERVAL env)"
   )
+  parser.add_argument(
+    "--min-interval",
+    type=int,
+    default=int(os.environ["MIN_INTERVAL"]) if "MIN_INTERVAL" in os.environ else None,
+    help="Minimum seconds between modem queries (default: the larger of 5 and --interval, or MIN_INTERVAL env)",
+  )
   parser.add_argument(
     "--log-level",
     default=os.getenv("LOG_LEVEL", "INFO").upper(),
     choices=["DEBUG", "INFO", "WARNING", "ERROR"],
     help="Log level (default: INFO or LOG_LEVEL env)",
   )
+  parser.add_argument(
+    "--fast-server",
+    action="store_true",
+    help="Serve /metrics from a minimal selectors-based loop instead of http.server",
+  )
+  parser.add_argument(
+    "--asyncio",
+    action="store_true",
+    help="Serve /metrics from an asyncio stream server instead of http.server",
+  )
 
   args = parser.parse_args()
 
-  # Initialize API
-  api = AlcatelClient(args.url, args.password)
+  # Initialize API with one pooled connection per query worker. The keep-alive
+  # expiry outlasts the update interval so connections are reused across
+  # collections instead of being re-established every cycle.
+  limits = httpx.Limits(max_keepalive_connections=QUERY_WORKERS, max_connections=QUERY_WORKERS, keepalive_expiry=args.interval * 2)
+  api = AlcatelClient(args.url, args.password, connection_limits=limits)
 
   # Initialize exporter
-  exporter = PrometheusExporter(api, args.interval)
+  exporter = PrometheusExporter(api, args.interval, args.min_interval)
 
   # Initial metrics collection
   print(f"Collecting initial metrics from {args.url}...")
   exporter.collect_metrics()
   print("✅ Initial metrics collected")
-
-  # Start HTTP server
-  handler = create_handler(exporter)
-  httpd = HTTPServer(("", args.port), handler)
+  exporter.start()
 
   print(f"🚀 Prometheus exporter started on port {args.port}")
   print(f"📊 Metrics available at: http://localhost:{args.port}/metrics")
   print(f"⏱️  Update interval: {args.interval} seconds")
   print("\nPress Ctrl+C to stop...")
 
+  if args.fast_server or args.asyncio:
+    try:
+      if args.asyncio:
+        serve_asyncio(exporter, args.port)
+      else:
+        serve_fast(exporter, args.port)
+    except KeyboardInterrupt:
+      print("\n🛑 Stopping exporter...")
+      exporter.stop()
+    return
+
+  # Start HTTP server; each request gets its own thread so concurrent scrapers do not queue
+  handler = create_handler(exporter)
+  httpd = ThreadingHTTPServer(("", args.port), handler)
+
   try:
     httpd.serve_forever()
   except KeyboardInterrupt:
     print("\n🛑 Stopping exporter...")
+    exporter.stop()
     httpd.shutdown()
 
 
@@ -15,6 +15,7 @@ Enhanced with:
 - Better error handling
 """
 
+import platform as plat
 import sys
 import time
 from pathlib import Path
@@ -25,36 +26,47 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from alcatel_modem_api import AlcatelClient
 from alcatel_modem_api.constants import get_network_type
 
+# Repeating the same strength within this many seconds is not announced again
+SAY_DEBOUNCE_SECONDS = 5
 
-def say_signal_strength(strength, platform="auto"):
+# Last announced (strength, monotonic time), so flapping of other values does not respawn the TTS process
+_last_said = (None, 0.0)
+
+
+def _resolve_tts(platform):
   """
-  Announce signal strength (platform-specific)
+  Resolve the text-to-speech backend for a platform
+
+  Backend modules are imported and the Windows SAPI voice is created here,
+  once, rather than on every announcement.
 
   Args:
-      strength: Signal strength value
-      platform: Platform to use ('auto', 'macos', 'windows', 'linux')
+      platform: Platform name ('darwin', 'macos', 'windows', 'linux')
+
+  Returns:
+      Function speak(strength), or None if the platform has no backend
   """
-  if platform == "auto":
-    import platform as plat
+  if platform == "darwin" or platform == "macos":
+    # macOS
+    import subprocess
 
-    platform = plat.system().lower()
+    def speak(strength):
+      subprocess.run(["say", str(strength)], check=False)
 
-  try:
-    if platform == "darwin" or platform == "macos":
-      # macOS
-      import subprocess
+  elif platform == "windows":
+    # Windows - use SAPI
+    import win32com.client
 
-      subprocess.run(["say", str(strength)], check=False)
-    elif platform == "windows":
-      # Windows - use SAPI
-      import win32com.client
+    speaker = win32com.client.Dispatch("SAPI.SpVoice")
 
-      speaker = win32com.client.Dispatch("SAPI.SpVoice")
+    def speak(strength):
       speaker.Speak(f"Signal strength {strength}")
-    elif platform == "linux":
-      # Linux - use espeak or festival
-      import subprocess
 
+  elif platform == "linux":
+    # Linux - use espeak or festival
+    import subprocess
+
+    def speak(strength):
       try:
         subprocess.run(["espeak", f"Signal strength {strength}"], check=False)
       except FileNotFoundError:
@@ -67,6 +79,47 @@ def say_signal_strength(strength, platform="auto"):
           )
         except FileNotFoundError:
           print("⚠️  Install 'espeak' or 'festival' for voice output on Linux")
+
+  else:
+    return None
+
+  return speak
+
+
+# Host platform, detected once at startup
+_PLATFORM = plat.system().lower()
+
+# Resolved TTS backends by platform name
+_tts_backends = {}
+
+
+def say_signal_strength(strength, platform="auto"):
+  """
+  Announce signal strength (platform-specific)
+
+  Announcements of an unchanged strength within SAY_DEBOUNCE_SECONDS
+  of the previous one are skipped.
+
+  Args:
+      strength: Signal strength value
+      platform: Platform to use ('auto', 'macos', 'windows', 'linux')
+  """
+  global _last_said
+
+  now = time.monotonic()
+  if strength == _last_said[0] and now - _last_said[1] < SAY_DEBOUNCE_SECONDS:
+    return
+  _last_said = (strength, now)
+
+  if platform == "auto":
+    platform = _PLATFORM
+
+  try:
+    if platform not in _tts_backends:
+      _tts_backends[platform] = _resolve_tts(platform)
+    speak = _tts_backends[platform]
+    if speak is not None:
+      speak(strength)
   except Exception as e:
     print(f"⚠️  Could not announce signal: {e}")
 
@@ -80,19 +133,19 @@ def main():
     epilog="""
 Examples:
   # Basic monitoring (print only)
-  python examples/signal.py -u http://192.168.1.1
+  python examples/signal_monitor.py -u http://192.168.1.1
 
   # With voice announcements (macOS)
-  python examples/signal.py -u http://192.168.1.1 --voice
+  python examples/signal_monitor.py -u http://192.168.1.1 --voice
 
   # With voice announcements (Windows)
-  python examples/signal.py -u http://192.168.1.1 --voice --platform windows
+  python examples/signal_monitor.py -u http://192.168.1.1 --voice --platform windows
 
   # Extended info (network type, RSSI, etc.)
-  python examples/signal.py -u http://192.168.1.1 -p admin --extended
+  python examples/signal_monitor.py -u http://192.168.1.1 -p admin --extended
 
   # Custom interval
-  python examples/signal.py -u http://192.168.1.1 --interval 2
+  python examples/signal_monitor.py -u http://192.168.1.1 --interval 2
         """,
   )
   parser.add_argument(
@@ -144,6 +197,9 @@ Examples:
   last_strength = None
   last_network_type = None
   last_rssi = None
+  # The network type code rarely changes, so only re-resolve its name when it does
+  last_network_type_code = None
+  network_type = None
 
   try:
     while True:
@@ -152,7 +208,9 @@ Examples:
         system_status = api.system.get_status()
         strength = system_status.signal_strength
         network_type_code = system_status.network_type
-        network_type = get_network_type(network_type_code)
+        if network_type_code != last_network_type_code:
+          network_type = get_network_type(network_type_code)
+          last_network_type_code = network_type_code
         network_name = system_status.network_name
 
         # Extended info (requires login)
@@ -174,14 +232,15 @@ Examples:
         if last_strength is not None:
           changed = strength != last_strength or network_type != last_network_type or (rssi is not None and rssi != last_rssi)
 
-        # Build status line
-        status_line = f"Signal: {strength}/5 | Network: {network_type} ({network_name})"
+        # Build status line (joined once instead of growing a string with +=)
+        parts = [f"Signal: {strength}/5", f"Network: {network_type} ({network_name})"]
         if rssi is not None:
-          status_line += f" | RSSI: {rssi} dBm"
+          parts.append(f"RSSI: {rssi} dBm")
         if rsrp is not None:
-          status_line += f" | RSRP: {rsrp} dBm"
+          parts.append(f"RSRP: {rsrp} dBm")
         if sinr is not None:
-          status_line += f" | SINR: {sinr} dB"
+          parts.append(f"SINR: {sinr} dB")
+        status_line = " | ".join(parts)
 
         # Print logic
         if args.quiet:
@@ -22,35 +22,45 @@ def wait_for_sms_response(api, sender_number="2222", timeout=60, check_interval=
       api: AlcatelClient instance
       sender_number: Sender phone number (e.g., "2222")
       timeout: Maximum wait time in seconds
-      check_interval: Check interval in seconds
+      check_interval: Maximum check interval in seconds (polling starts at 100 ms and backs off)
   """
   print(f"📱 Waiting for SMS from {sender_number}...")
   print(f"⏱️  Maximum wait time: {timeout} seconds")
   print()
 
   start_time = time.time()
-  last_count = 0
+  last_count = None
+  next_report = 10
+  # Poll quickly at first, backing off towards check_interval while nothing changes
+  delay = 0.1
 
   while time.time() - start_time < timeout:
     try:
       storage = api.sms.get_storage_state()
       unread_count = storage.get("UnreadSMSCount", 0)
 
-      if unread_count > last_count:
+      if last_count is None:
+        last_count = unread_count
+      elif unread_count > last_count:
         print(f"✅ New SMS detected! (Unread: {unread_count})")
         print("   Checking SMS list...")
         # TODO: Get SMS list and find the new SMS
         break
 
       elapsed = int(time.time() - start_time)
-      if elapsed % 10 == 0:  # Show status every 10 seconds
+      if elapsed >= next_report:  # Show status every 10 seconds
         print(f"⏳ Waiting... ({elapsed}/{timeout} seconds)")
+        next_report += 10
 
-      time.sleep(check_interval)
+      time.sleep(delay)
+      delay = min(delay * 1.5, check_interval)
 
     except Exception as e:
       print(f"⚠️  Error during check: {e}")
+      # Wait the full interval after an error (e.g. modem unreachable), then
+      # poll quickly again once the checks succeed
       time.sleep(check_interval)
+      delay = 0.1
 
   if time.time() - start_time >= timeout:
     print("⏱️  Timeout! SMS not received.")
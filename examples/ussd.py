@@ -8,6 +8,7 @@ http://192.168.1.1/default.html#more/ussdSetting.html
 """
 
 import sys
+import time
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -22,6 +23,29 @@ USSD_CODES = {
   # Add more codes for your carrier
 }
 
+# USSD SendState values that mean the modem is done (2 = success, 3 = error)
+USSD_FINAL_STATES = (2, 3)
+
+
+def wait_for_ussd_result(api, timeout, poll_interval=0.25):
+  """
+  Poll the USSD send result until the modem reports success or error
+
+  Args:
+      api: AlcatelClient instance
+      timeout: Maximum wait time in seconds
+      poll_interval: Seconds between checks (default: 0.25)
+
+  Returns:
+      Last USSD result dictionary (may still be pending on timeout)
+  """
+  deadline = time.time() + timeout
+  while True:
+    result = api.system.get_ussd_result()
+    if result.get("SendState") in USSD_FINAL_STATES or time.time() >= deadline:
+      return result
+    time.sleep(poll_interval)
+
 
 def main():
   import argparse
@@ -31,7 +55,7 @@ def main():
   parser.add_argument("-p", "--password", help="Admin password (required for sending USSD)")
   parser.add_argument("-c", "--code", help="USSD code (e.g., *222#)")
   parser.add_argument("-l", "--list", action="store_true", help="List available USSD codes")
-  parser.add_argument("--wait", type=int, default=5, help="Wait seconds before getting result (default: 5)")
+  parser.add_argument("--wait", type=int, default=5, help="Maximum seconds to wait for the result (default: 5)")
 
   args = parser.parse_args()
 
@@ -53,10 +77,11 @@ def main():
   api = AlcatelClient(args.url, args.password)
 
   print(f"Sending USSD code: {args.code}")
-  print(f"Waiting {args.wait} seconds for response...")
+  print(f"Waiting up to {args.wait} seconds for response...")
 
   try:
-    result = api.system.send_ussd_code(args.code, wait_seconds=args.wait)
+    api.system.send_ussd(args.code)
+    result = wait_for_ussd_result(api, args.wait)
 
     send_state = result.get("SendState", 0)
     ussd_content = result.get("UssdContent", "")
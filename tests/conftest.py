@@ -35,6 +35,14 @@ def mock_api_with_password(temp_session_file):
     yield client, respx
 
 
+@pytest.fixture(scope="session")
+def parity_client():
+  """Shared AlcatelClient for tests that only introspect the client and endpoint classes"""
+  client = AlcatelClient("http://192.168.1.1")
+  yield client
+  client.close()
+
+
 @pytest.fixture
 def valid_aes_key():
   """Valid AES key (16 bytes) for encryption tests"""
@@ -2,7 +2,11 @@
 Tests for AlcatelClient
 """
 
+import asyncio
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 import pytest
@@ -12,35 +16,34 @@ from alcatel_modem_api import (
   AlcatelAPIError,
   AlcatelClient,
   AlcatelConnectionError,
+  AlcatelFeatureNotSupportedError,
+  AlcatelSimMissingError,
+  AlcatelSystemBusyError,
   AlcatelTimeoutError,
   AuthenticationError,
   FileTokenStorage,
 )
+from alcatel_modem_api import client as client_module
 
 
-def test_optimistic_login_flow(mock_api_with_password, valid_aes_key, valid_aes_iv):
-  """Test optimistic authentication: try command first, login on auth error"""
-  client, m = mock_api_with_password
+def test_optimistic_login_flow(temp_session_file, mock_api_with_password, valid_aes_key, valid_aes_iv):
+  """Test optimistic authentication: try command first with the stored token, login on auth error"""
+  # Stored token from an earlier session, which the modem no longer accepts
+  with open(temp_session_file, "w") as f:
+    f.write("stale_token")
+
+  _, m = mock_api_with_password
+  client = AlcatelClient(password="secret", session_file=temp_session_file)
 
-  # Track call count to handle recursion in _get_login_state()
-  call_count = {"count": 0}
   login_attempted = {"done": False}
+  methods = []
 
   def response_handler(request):
-    call_count["count"] += 1
     import json
 
-    # Access request body - use read() for httpx Request objects
-    try:
-      content = request.read() if hasattr(request, "read") else (request.content if hasattr(request, "content") else b"")
-      data = json.loads(content) if content else {}
-    except (AttributeError, json.JSONDecodeError):
-      data = {}
+    data = json.loads(request.content)
     method = data.get("method", "")
-
-    # First few GetLoginState calls fail (from _get_login_state recursion)
-    if method == "GetLoginState" and not login_attempted["done"]:
-      return httpx.Response(200, json={"error": {"code": -32699, "message": "Auth Failure"}})
+    methods.append(method)
 
     # Login attempts
     if method == "Login":
@@ -52,12 +55,8 @@ def test_optimistic_login_flow(mock_api_with_password, valid_aes_key, valid_aes_
       login_attempted["done"] = True
       return httpx.Response(200, json={"result": {"token": "new_token", "param0": valid_aes_key, "param1": valid_aes_iv}})
 
-    # After login, GetLoginState succeeds
-    if method == "GetLoginState":
-      return httpx.Response(200, json={"result": {"State": 1}})
-
-    # GetSystemStatus succeeds
-    if method == "GetSystemStatus":
+    # GetSystemStatus succeeds once logged in
+    if method == "GetSystemStatus" and login_attempted["done"]:
       return httpx.Response(200, json={"result": {"NetworkName": "TestNet"}})
 
     # Default: auth error
@@ -67,9 +66,160 @@ def test_optimistic_login_flow(mock_api_with_password, valid_aes_key, valid_aes_
 
   result = client.run("GetSystemStatus")
   assert result["NetworkName"] == "TestNet"
-  # Should have at least 3 calls: GetLoginState (fails), Login (encrypted succeeds), GetSystemStatus (succeeds)
+  # No GetLoginState probe: the command is tried first, rejected, then retried after login
   # Note: The login flow tries encrypted first, and if it succeeds, doesn't retry with unencrypted
-  assert len(respx.calls) >= 3
+  assert methods == ["GetSystemStatus", "Login", "GetSystemStatus"]
+
+
+def test_login_without_stored_token(mock_api_with_password, valid_aes_key, valid_aes_iv):
+  """Test that a client without a stored token logs in once up front, without probing GetLoginState"""
+  client, m = mock_api_with_password
+
+  methods = []
+
+  def response_handler(request):
+    method = json.loads(request.content).get("method", "")
+    methods.append(method)
+    if method == "Login":
+      return httpx.Response(200, json={"result": {"token": "new_token", "param0": valid_aes_key, "param1": valid_aes_iv}})
+    return httpx.Response(200, json={"result": {"NetworkName": "TestNet"}})
+
+  m.post("http://192.168.1.1/jrd/webapi").mock(side_effect=response_handler)
+
+  client.run("GetSystemStatus")
+  client.run("GetSystemStatus")
+
+  assert methods == ["Login", "GetSystemStatus", "GetSystemStatus"]
+
+
+def test_concurrent_relogin_is_serialized(temp_session_file, mock_api_with_password, valid_aes_key, valid_aes_iv):
+  """Test that threads sharing a client whose token was rejected log in only once"""
+  with open(temp_session_file, "w") as f:
+    f.write("stale_token")
+
+  _, m = mock_api_with_password
+  client = AlcatelClient(password="secret", session_file=temp_session_file)
+
+  workers = 4
+  # Every worker is rejected with the stale token before any of them logs in
+  all_rejected = threading.Barrier(workers)
+  logins = []
+
+  def response_handler(request):
+    method = json.loads(request.content).get("method", "")
+    if method == "Login":
+      logins.append(method)
+      return httpx.Response(200, json={"result": {"token": "new_token", "param0": valid_aes_key, "param1": valid_aes_iv}})
+    if request.headers.get("_TclRequestVerificationToken") == "stale_token":
+      all_rejected.wait(timeout=2)
+      return httpx.Response(200, json={"error": {"code": -32699, "message": "Auth Failure"}})
+    return httpx.Response(200, json={"result": {"NetworkName": "TestNet"}})
+
+  m.post("http://192.168.1.1/jrd/webapi").mock(side_effect=response_handler)
+
+  with ThreadPoolExecutor(max_workers=workers) as pool:
+    results = list(pool.map(lambda _: client.run("GetSystemStatus"), range(workers)))
+
+  assert [result["NetworkName"] for result in results] == ["TestNet"] * workers
+  assert len(logins) == 1
+
+
+def test_concurrent_relogin_is_serialized_async(temp_session_file, mock_api_with_password, valid_aes_key, valid_aes_iv):
+  """Test that concurrent async commands whose token was rejected log in only once"""
+  with open(temp_session_file, "w") as f:
+    f.write("stale_token")
+
+  _, m = mock_api_with_password
+  client = AlcatelClient(password="secret", session_file=temp_session_file)
+
+  tasks = 4
+  rejected = 0
+  logins = []
+
+  async def main():
+    # Every task is rejected with the stale token before any of them logs in
+    all_rejected = asyncio.Event()
+
+    async def response_handler(request):
+      nonlocal rejected
+      method = json.loads(request.content).get("method", "")
+      if method == "Login":
+        logins.append(method)
+        return httpx.Response(200, json={"result": {"token": "new_token", "param0": valid_aes_key, "param1": valid_aes_iv}})
+      if request.headers.get("_TclRequestVerificationToken") == "stale_token":
+        rejected += 1
+        if rejected == tasks:
+          all_rejected.set()
+        await asyncio.wait_for(all_rejected.wait(), timeout=2)
+        return httpx.Response(200, json={"error": {"code": -32699, "message": "Auth Failure"}})
+      return httpx.Response(200, json={"result": {"NetworkName": "TestNet"}})
+
+    m.post("http://192.168.1.1/jrd/webapi").mock(side_effect=response_handler)
+    return await asyncio.gather(*(client.run_async("GetSystemStatus") for _ in range(tasks)))
+
+  results = asyncio.run(main())
+
+  assert [result["NetworkName"] for result in results] == ["TestNet"] * tasks
+  assert len(logins) == 1
+
+
+def test_clients_sharing_session_file_reuse_token(temp_session_file, mock_api_with_password, valid_aes_key, valid_aes_iv):
+  """Test that a client picks up the token another client sharing its session file logged in with"""
+  _, m = mock_api_with_password
+  first = AlcatelClient(password="secret", session_file=temp_session_file)
+  # Built before the first client logs in, so it starts without a token in its headers
+  second = AlcatelClient(password="secret", session_file=temp_session_file)
+
+  requests = []
+
+  def response_handler(request):
+    method = json.loads(request.content).get("method", "")
+    token = request.headers.get("_TclRequestVerificationToken")
+    requests.append((method, token))
+    if method == "Login":
+      return httpx.Response(200, json={"result": {"token": "new_token", "param0": valid_aes_key, "param1": valid_aes_iv}})
+    if token != first._token_manager.get_token():
+      return httpx.Response(200, json={"error": {"code": -32699, "message": "Auth Failure"}})
+    return httpx.Response(200, json={"result": {"NetworkName": "TestNet"}})
+
+  m.post("http://192.168.1.1/jrd/webapi").mock(side_effect=response_handler)
+
+  first.run("GetSystemStatus")
+  second.run("GetSystemStatus")
+
+  token = first._token_manager.get_token()
+  assert token
+  assert requests == [("Login", None), ("GetSystemStatus", token), ("GetSystemStatus", token)]
+
+
+def test_auth_error_retries_with_token_from_sibling_client(temp_session_file, mock_api_with_password, valid_aes_key, valid_aes_iv):
+  """Test that a rejected client retries with a token another client stored meanwhile, instead of logging in"""
+  with open(temp_session_file, "w") as f:
+    f.write("stale_token")
+
+  _, m = mock_api_with_password
+  first = AlcatelClient(password="secret", session_file=temp_session_file)
+  second = AlcatelClient(password="secret", session_file=temp_session_file)
+
+  logins = []
+
+  def response_handler(request):
+    method = json.loads(request.content).get("method", "")
+    token = request.headers.get("_TclRequestVerificationToken")
+    if method == "Login":
+      logins.append(method)
+      return httpx.Response(200, json={"result": {"token": "new_token", "param0": valid_aes_key, "param1": valid_aes_iv}})
+    if token == "stale_token":
+      if method == "GetSystemStatus":
+        # While the second client's request is in flight, the first client logs in
+        first.run("GetNetworkInfo")
+      return httpx.Response(200, json={"error": {"code": -32699, "message": "Auth Failure"}})
+    return httpx.Response(200, json={"result": {"NetworkName": "TestNet"}})
+
+  m.post("http://192.168.1.1/jrd/webapi").mock(side_effect=response_handler)
+
+  assert second.run("GetSystemStatus") == {"NetworkName": "TestNet"}
+  assert logins == ["Login"]
 
 
 def test_json_rpc_id_format(mock_api):
@@ -91,6 +241,77 @@ def test_json_rpc_id_format(mock_api):
   assert isinstance(request_json["id"], str)
 
 
+def test_batch_round_trip(mock_api):
+  """Test that run_batch sends all commands in one request and returns results in call order"""
+  client, m = mock_api
+
+  def response_handler(request):
+    batch = json.loads(request.content)
+    # Answer out of order to check that results are matched by ID
+    return httpx.Response(200, json=[{"jsonrpc": "2.0", "id": rpc["id"], "result": {"method": rpc["method"]}} for rpc in reversed(batch)])
+
+  m.post("http://192.168.1.1/jrd/webapi").mock(side_effect=response_handler)
+
+  commands = ["GetSystemStatus", "GetNetworkInfo", "GetConnectionState"]
+  results = client.run_batch([(command, None) for command in commands])
+
+  assert len(respx.calls) == 1
+  assert [result["method"] for result in results] == commands
+
+
+def test_run_many_single_login(mock_api_with_password, valid_aes_key, valid_aes_iv):
+  """Test that run_many logs in once for all commands and returns results in call order"""
+  client, m = mock_api_with_password
+  methods = []
+
+  def response_handler(request):
+    rpc = json.loads(request.content)
+    methods.append(rpc["method"])
+    if rpc["method"] == "Login":
+      return httpx.Response(200, json={"result": {"token": "new_token", "param0": valid_aes_key, "param1": valid_aes_iv}})
+    return httpx.Response(200, json={"jsonrpc": "2.0", "id": rpc["id"], "result": {"method": rpc["method"]}})
+
+  m.post("http://192.168.1.1/jrd/webapi").mock(side_effect=response_handler)
+
+  commands = ["GetSystemStatus", "GetNetworkInfo", "GetConnectionState"]
+  results = client.run_many([(command, None) for command in commands])
+
+  assert methods == ["Login", *commands]
+  assert [result["method"] for result in results] == commands
+
+
+def test_run_many_async(mock_api):
+  """Test that run_many_async has every command in flight at once and returns results in call order"""
+  client, m = mock_api
+  commands = ["GetSystemStatus", "GetNetworkInfo", "GetConnectionState"]
+  in_flight = 0
+  max_in_flight = 0
+
+  async def main():
+    all_in_flight = asyncio.Event()
+
+    async def response_handler(request):
+      nonlocal in_flight, max_in_flight
+      in_flight += 1
+      max_in_flight = max(max_in_flight, in_flight)
+      if in_flight == len(commands):
+        all_in_flight.set()
+      # A sequential implementation never gets here with all commands pending, so it times out
+      await asyncio.wait_for(all_in_flight.wait(), timeout=2)
+      in_flight -= 1
+      rpc = json.loads(request.content)
+      return httpx.Response(200, json={"jsonrpc": "2.0", "id": rpc["id"], "result": {"method": rpc["method"]}})
+
+    m.post("http://192.168.1.1/jrd/webapi").mock(side_effect=response_handler)
+    return await client.run_many_async([(command, None) for command in commands])
+
+  results = asyncio.run(main())
+
+  assert len(respx.calls) == 3
+  assert max_in_flight == len(commands)
+  assert [result["method"] for result in results] == commands
+
+
 def test_token_storage_persistence(temp_session_file):
   """Test that token storage persists across API instances"""
   # Create first API instance and save token
@@ -151,7 +372,33 @@ def test_timeout_error(mock_api):
     client.run("GetSystemStatus")
 
 
-def test_invalid_json_response(mock_api):
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+  """Run a test with orjson (when installed) and with the stdlib json fallback"""
+  if request.param == "orjson":
+    pytest.importorskip("orjson")
+  else:
+    monkeypatch.setattr(client_module, "orjson", None)
+  return request.param
+
+
+def test_json_round_trip(mock_api, json_backend):
+  """Test that payloads are encoded and responses decoded the same way by both JSON backends"""
+  client, m = mock_api
+
+  def response_handler(request):
+    rpc = json.loads(request.content)
+    # Compact UTF-8 output, non-ASCII characters not escaped
+    assert request.content == json.dumps(rpc, ensure_ascii=False, separators=(",", ":")).encode()
+    return httpx.Response(200, json={"jsonrpc": "2.0", "id": rpc["id"], "result": {"echo": rpc["params"]["Content"]}})
+
+  m.post("http://192.168.1.1/jrd/webapi").mock(side_effect=response_handler)
+
+  result = client.run("SendSMS", Content="Merhaba dünya ✓")
+  assert result == {"echo": "Merhaba dünya ✓"}
+
+
+def test_invalid_json_response(mock_api, json_backend):
   """Test handling of invalid JSON responses"""
   client, m = mock_api
 
@@ -173,6 +420,26 @@ def test_api_error_response(mock_api):
   assert "Command failed" in str(exc_info.value)
 
 
+@pytest.mark.parametrize(
+  "message,exception_class",
+  [
+    ("System busy", AlcatelSystemBusyError),
+    ("SIM card not detected", AlcatelSimMissingError),
+    ("Feature not supported", AlcatelFeatureNotSupportedError),
+  ],
+)
+def test_api_error_message_mapping(mock_api, message, exception_class):
+  """Test that known error messages map to specific exceptions carrying the error code"""
+  client, m = mock_api
+
+  m.post("http://192.168.1.1/jrd/webapi").mock(return_value=httpx.Response(200, json={"error": {"code": 7, "message": message}}))
+
+  with pytest.raises(exception_class) as exc_info:
+    client.run("GetSystemStatus")
+
+  assert exc_info.value.error_code == 7
+
+
 def test_custom_token_manager(temp_session_file):
   """Test that custom session file path can be used"""
   client = AlcatelClient(session_file=temp_session_file)
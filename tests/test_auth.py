@@ -62,6 +62,38 @@ def test_file_token_storage():
     assert not os.path.exists(session_file)
 
 
+def test_file_token_storage_shared_per_path():
+  """Test that storages for the same session file share one instance"""
+  with tempfile.TemporaryDirectory() as tmpdir:
+    session_file = os.path.join(tmpdir, "test_session")
+
+    storage = FileTokenStorage(session_file)
+    storage.save_token("test_token")
+
+    assert FileTokenStorage(os.path.relpath(session_file)) is storage
+    assert FileTokenStorage(os.path.join(tmpdir, "other_session")) is not storage
+
+
+def test_file_token_storage_subclass_per_path():
+  """Test that a subclass gets its own initialized instance for a path already in use"""
+
+  class CustomStorage(FileTokenStorage):
+    def __init__(self, session_file=None):
+      super().__init__(session_file)
+      self.custom = True
+
+  with tempfile.TemporaryDirectory() as tmpdir:
+    session_file = os.path.join(tmpdir, "test_session")
+
+    storage = FileTokenStorage(session_file)
+    custom = CustomStorage(session_file)
+
+    assert type(custom) is CustomStorage
+    assert custom.custom
+    assert CustomStorage(session_file) is custom
+    assert FileTokenStorage(session_file) is storage
+
+
 def test_file_token_storage_default_path():
   """Test file token storage uses default path"""
   storage = FileTokenStorage()
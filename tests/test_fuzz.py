@@ -20,42 +20,25 @@ from alcatel_modem_api.models import (
   SystemStatus,
 )
 
-
-@given(st.dictionaries(st.text(), st.one_of(st.text(), st.integers(), st.floats(), st.booleans(), st.none())))
-def test_system_status_fuzz(data: dict[str, Any]) -> None:
-  """Test SystemStatus model with fuzzed input"""
-  try:
-    # SystemStatus should handle any dict without crashing
-    status = SystemStatus.model_validate(data)
-    # If validation succeeds, ensure it's a valid SystemStatus
-    assert isinstance(status, SystemStatus)
-  except Exception:
-    # It's OK if validation fails on invalid data, but it shouldn't crash
-    pass
-
-
-@given(st.dictionaries(st.text(), st.one_of(st.text(), st.integers(), st.floats(), st.booleans(), st.none())))
-def test_extended_status_fuzz(data: dict[str, Any]) -> None:
-  """Test ExtendedStatus model with fuzzed input"""
-  try:
-    status = ExtendedStatus.model_validate(data)
-    assert isinstance(status, ExtendedStatus)
-  except Exception:
-    # Validation failure is acceptable, crash is not
-    pass
+# Flat JSON-like dicts, as a misbehaving firmware might return them
+FUZZ_DICTS = st.dictionaries(st.text(), st.one_of(st.text(), st.integers(), st.floats(), st.booleans(), st.none()))
 
 
-@given(st.dictionaries(st.text(), st.one_of(st.text(), st.integers(), st.floats(), st.booleans(), st.none())))
-def test_network_info_fuzz(data: dict[str, Any]) -> None:
-  """Test NetworkInfo model with fuzzed input"""
+@pytest.mark.parametrize("model", [SystemStatus, ExtendedStatus, NetworkInfo, ConnectionState], ids=lambda model: model.__name__)
+@given(data=FUZZ_DICTS)
+def test_model_fuzz(model: Any, data: dict[str, Any]) -> None:
+  """Test response models with fuzzed input"""
   try:
-    info = NetworkInfo.model_validate(data)
-    assert isinstance(info, NetworkInfo)
+    # from_dict is the entry point the endpoints use
+    result = model.from_dict(data)
+    # If validation succeeds, ensure it's an instance of the model
+    assert isinstance(result, model)
   except Exception:
+    # It's OK if validation fails on invalid data, but it shouldn't crash
     pass
 
 
-@given(st.lists(st.dictionaries(st.text(), st.one_of(st.text(), st.integers(), st.floats(), st.booleans(), st.none()))))
+@given(st.lists(FUZZ_DICTS))
 def test_sms_message_list_fuzz(data_list: list[dict[str, Any]]) -> None:
   """Test SMSMessage model with fuzzed list input"""
   for data in data_list:
@@ -114,13 +97,3 @@ def test_coerce_str_or_none_fuzz(value: Any) -> None:
   result = coerce_str_or_none(value)
   # Should always return str or None, never crash
   assert result is None or isinstance(result, str)
-
-
-@given(st.dictionaries(st.text(), st.one_of(st.text(), st.integers(), st.floats(), st.booleans(), st.none())))
-def test_connection_state_fuzz(data: dict[str, Any]) -> None:
-  """Test ConnectionState model with fuzzed input"""
-  try:
-    state = ConnectionState.model_validate(data)
-    assert isinstance(state, ConnectionState)
-  except Exception:
-    pass
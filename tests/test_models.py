@@ -100,6 +100,22 @@ def test_extended_status_from_dict():
   assert status.network_name == "Test Network"
 
 
+def test_extended_status_signal_quality():
+  """Test ExtendedStatus signal quality follows the current signal metrics"""
+  status = ExtendedStatus.from_dict({"rssi": -70, "rsrp": -92})
+  assert status.signal_quality_percent == 50
+  assert status.signal_quality_percent == NetworkInfo(rssi=-70, rsrp=-92).signal_quality_percent
+  assert "signal_quality_percent" not in status.model_dump()
+
+  # Derived on every access, so updates and copies are never stale
+  status.rsrp = -44
+  assert status.signal_quality_percent == 100
+  assert status.model_copy(update={"rsrp": -140}).signal_quality_percent == 0
+
+  assert ExtendedStatus.from_dict({"rssi": -82}).signal_quality_percent == 50
+  assert ExtendedStatus().signal_quality_percent == 0
+
+
 def test_sms_message_from_dict():
   """Test SMSMessage creation from dict"""
   data = {
@@ -2,97 +2,105 @@
 Tests for SMS module
 """
 
-import json
+from typing import Any
 
-import httpx
 import pytest
-import respx
 
 from alcatel_modem_api import AlcatelAPIError
 
+# Canned JSON-RPC responses for GetSMSListByContactNum, keyed by scenario
+SMS_LIST_RESPONSES: dict[str, dict[str, Any]] = {
+  "empty": {"result": []},
+  "with_messages": {"result": [{"SMSId": 1, "PhoneNumber": "+1234567890", "SMSContent": "Test message"}]},
+  "dict_with_list": {"result": {"SMSList": [{"SMSId": 1, "PhoneNumber": "+1234567890"}]}},
+  "error_in_result": {"result": {"error": {"message": "SMS retrieval failed"}}},
+  "dict_without_list": {"result": {"Status": "ok"}},
+}
 
-def test_get_sms_list_empty(mock_api):
-  """Test getting SMS list when empty"""
-  client, m = mock_api
 
-  m.post("http://192.168.1.1/jrd/webapi").mock(return_value=httpx.Response(200, json={"result": []}))
+@pytest.fixture
+def sms_rpc(mock_api, monkeypatch):
+  """
+  Serve canned responses from the client's RPC layer, bypassing HTTP
+
+  A single responder is installed for the whole test and answers with the
+  SMS_LIST_RESPONSES entry named by current["scenario"] (default "empty").
+
+  Returns the SMS endpoint, the current scenario dict, and the list of
+  JSON-RPC payloads sent.
+  """
+  client, _ = mock_api
+  current = {"scenario": "empty"}
+  sent: list[Any] = []
+
+  def post_rpc(payload: Any) -> Any:
+    sent.append(payload)
+    return SMS_LIST_RESPONSES[current["scenario"]]
 
-  result = client.sms.list()
+  monkeypatch.setattr(client, "_post_rpc", post_rpc)
+  return client.sms, current, sent
+
+
+def test_get_sms_list_empty(sms_rpc):
+  """Test getting SMS list when empty"""
+  sms, current, _ = sms_rpc
+  current["scenario"] = "empty"
+
+  result = sms.list()
   assert isinstance(result, list)
   assert len(result) == 0
 
 
-def test_get_sms_list_with_messages(mock_api):
+def test_get_sms_list_with_messages(sms_rpc):
   """Test getting SMS list with messages"""
-  client, m = mock_api
-
-  m.post("http://192.168.1.1/jrd/webapi").mock(
-    return_value=httpx.Response(
-      200,
-      json={
-        "result": [
-          {"SMSId": 1, "PhoneNumber": "+1234567890", "SMSContent": "Test message"},
-        ],
-      },
-    ),
-  )
-
-  result = client.sms.list()
+  sms, current, _ = sms_rpc
+  current["scenario"] = "with_messages"
+
+  result = sms.list()
   assert isinstance(result, list)
   assert len(result) == 1
   # SMSMessage is now a Pydantic model
   assert result[0].sms_id == 1
 
 
-def test_get_sms_list_dict_with_list(mock_api):
+def test_get_sms_list_dict_with_list(sms_rpc):
   """Test getting SMS list when API returns dict with list inside"""
-  client, m = mock_api
-
-  m.post("http://192.168.1.1/jrd/webapi").mock(
-    return_value=httpx.Response(200, json={"result": {"SMSList": [{"SMSId": 1, "PhoneNumber": "+1234567890"}]}}),
-  )
+  sms, current, _ = sms_rpc
+  current["scenario"] = "dict_with_list"
 
-  result = client.sms.list()
+  result = sms.list()
   assert isinstance(result, list)
   assert len(result) == 1
 
 
-def test_get_sms_list_error_response(mock_api):
+def test_get_sms_list_error_response(sms_rpc):
   """Test that error responses raise AlcatelAPIError"""
-  client, m = mock_api
-
-  # First call returns error in result (edge case)
-  m.post("http://192.168.1.1/jrd/webapi").mock(
-    return_value=httpx.Response(200, json={"result": {"error": {"message": "SMS retrieval failed"}}}),
-  )
+  sms, current, _ = sms_rpc
+  # Error in result (edge case)
+  current["scenario"] = "error_in_result"
 
   with pytest.raises(AlcatelAPIError):
-    client.sms.list()
+    sms.list()
 
 
-def test_get_sms_list_dict_without_list(mock_api):
+def test_get_sms_list_dict_without_list(sms_rpc):
   """Test getting SMS list when API returns dict without list key"""
-  client, m = mock_api
-
-  m.post("http://192.168.1.1/jrd/webapi").mock(return_value=httpx.Response(200, json={"result": {"Status": "ok"}}))
+  sms, current, _ = sms_rpc
+  current["scenario"] = "dict_without_list"
 
-  result = client.sms.list()
+  result = sms.list()
   # Should return empty list, not wrap dict in list
   assert isinstance(result, list)
   assert len(result) == 0
 
 
-def test_get_sms_list_with_contact_number(mock_api):
+def test_get_sms_list_with_contact_number(sms_rpc):
   """Test getting SMS list filtered by contact number"""
-  client, m = mock_api
-
-  m.post("http://192.168.1.1/jrd/webapi").mock(return_value=httpx.Response(200, json={"result": []}))
+  sms, current, sent = sms_rpc
+  current["scenario"] = "empty"
 
-  result = client.sms.list(contact_number="+1234567890")
+  result = sms.list(contact_number="+1234567890")
   assert isinstance(result, list)
 
   # Check that ContactNum parameter was passed
-  call = respx.calls.last
-  request_body = call.request.content
-  request_json = json.loads(request_body)
-  assert request_json["params"]["ContactNum"] == "+1234567890"
+  assert sent[-1]["params"]["ContactNum"] == "+1234567890"